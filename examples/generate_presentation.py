@@ -10,12 +10,15 @@ This script provides examples of:
 
 import asyncio
 import sys
-import os
 import json
+import tempfile
 from pathlib import Path
 
+# Project root, resolved once
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
 # Add the project root to the Python path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+sys.path.insert(0, str(PROJECT_ROOT))
 
 from src.main import PresentationGenerator
 from src.core.pipeline_factory import PipelineFactory
@@ -56,11 +59,11 @@ async def example_2_programmatic_api():
         "max_retries": 2,
         "checkpoints_enabled": True,
         "fallback_templates_enabled": True,
-        "base_dir": os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+        "base_dir": str(PROJECT_ROOT)
     }
     
-    # Create generator and generate presentation
-    generator = PresentationGenerator()
+    # Create generator with the in-memory configuration and generate presentation
+    generator = PresentationGenerator(config=config)
     
     try:
         print(f"Generating presentation on '{input_data['topic']}'...")
@@ -69,25 +72,31 @@ async def example_2_programmatic_api():
     except Exception as e:
         print(f"✗ Failed to generate presentation: {e}")
 
+def create_generator_from_config_file(config):
+    """Write config to a temporary JSON file and create a generator from it."""
+    # The file is removed automatically when the block exits
+    with tempfile.NamedTemporaryFile('w', suffix='.json', delete=True) as f:
+        json.dump(config, f, indent=2)
+        f.flush()
+        
+        # The generator reads the config file once, here
+        return PresentationGenerator(Path(f.name))
+
 async def example_3_with_config_file():
     """Example 3: Use a configuration file."""
     print("\n=== Example 3: Using a Configuration File ===")
     
-    # Create a temporary configuration file
+    # Configuration to write to a temporary file
     config = {
         "theme": "corporate",
         "output_format": "pptx",
         "max_retries": 3,
         "checkpoints_enabled": True,
         "fallback_templates_enabled": True,
-        "base_dir": os.path.abspath(os.path.join(os.path.dirname(__file__), '..')),
+        "base_dir": str(PROJECT_ROOT),
         "templates_dir": "templates/corporate"
     }
     
-    config_path = Path("examples/temp_config.json")
-    with open(config_path, 'w') as f:
-        json.dump(config, f, indent=2)
-    
     # Create input data
     input_data = {
         "topic": "Digital Marketing Strategies",
@@ -97,8 +106,8 @@ async def example_3_with_config_file():
         "company": "Digital Innovations Inc."
     }
     
-    # Create generator with config file and generate presentation
-    generator = PresentationGenerator(config_path)
+    # Create generator with config file; the file I/O runs off the event loop
+    generator = await asyncio.to_thread(create_generator_from_config_file, config)
     
     try:
         print(f"Generating presentation using configuration file...")
@@ -106,10 +115,6 @@ async def example_3_with_config_file():
         print(f"✓ Presentation generated successfully: {output_path}")
     except Exception as e:
         print(f"✗ Failed to generate presentation: {e}")
-    
-    # Clean up temporary config file
-    if config_path.exists():
-        os.remove(config_path)
 
 async def example_4_advanced_pipeline_usage():
     """Example 4: Advanced usage with direct pipeline factory access."""
@@ -157,9 +162,13 @@ async def main():
     print("========================================")
     
     await example_1_simple_cli()
-    await example_2_programmatic_api()
-    await example_3_with_config_file()
-    await example_4_advanced_pipeline_usage()
+    
+    # The remaining examples are independent, so run them concurrently
+    await asyncio.gather(
+        example_2_programmatic_api(),
+        example_3_with_config_file(),
+        example_4_advanced_pipeline_usage()
+    )
 
 if __name__ == "__main__":
     asyncio.run(main()) 
\ No newline at end of file
@@ -3,32 +3,139 @@ Example script demonstrating how to use the OpenAI client and prompt templates f
 """
 import os
 import json
+import asyncio
 from dotenv import load_dotenv
-from src.core.openai_client import AssistantsAPIClient
+from openai import AsyncOpenAI
+from src.core.openai_client import OpenAIClient
 from src.core.prompt_templates import generate_slide_prompt
 
-def main():
-    # Load environment variables
-    load_dotenv()
+# Maximum number of slides generated at the same time
+MAX_CONCURRENT_REQUESTS = 5
+
+# Model used for the single batched request
+BATCH_MODEL = "gpt-4o"
+
+INSTRUCTIONS = """
+You are an expert presentation creator. Your task is to generate professional,
+engaging, and well-structured slide content based on the provided prompts.
+Follow these guidelines:
+1. Keep content concise and impactful
+2. Use clear and professional language
+3. Maintain consistency in tone and style
+4. Structure information logically
+5. Highlight key points effectively
+"""
+
+# Structured output schema for the batched request: one entry per slide
+SLIDES_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "slides": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "slide_type": {"type": "string"},
+                    "content": {"type": "string"}
+                },
+                "required": ["slide_type", "content"],
+                "additionalProperties": False
+            }
+        }
+    },
+    "required": ["slides"],
+    "additionalProperties": False
+}
+
+# Run statuses that will never reach 'completed'
+TERMINAL_RUN_STATUSES = {'failed', 'cancelled', 'expired'}
+
+async def wait_for_run(client, thread_id, run_id, initial=0.05, cap=1.0):
+    """Poll a run until it completes, doubling the delay between polls up to cap."""
+    delay = initial
+    while True:
+        status = await client.get_run_status(thread_id, run_id)
+        if status.status == 'completed':
+            return status
+        if status.status in TERMINAL_RUN_STATUSES:
+            raise RuntimeError(f"Assistant run {run_id} ended with status '{status.status}'")
+        await asyncio.sleep(delay)
+        delay = min(delay * 2, cap)
+
+async def generate_one(client, assistant_id, slide_type, variables, semaphore):
+    """Generate the content for a single slide on its own thread."""
+    async with semaphore:
+        # Each slide gets its own thread so runs don't block each other
+        thread = await client.create_thread()
+        
+        # Generate the prompt using our templates
+        prompt = generate_slide_prompt(slide_type, **variables)
+        
+        # Add the prompt to the thread
+        await client.add_message(thread.id, prompt)
+        
+        # Run the assistant to generate content
+        run = await client.run_assistant(thread.id, assistant_id)
+        
+        # Wait for completion
+        await wait_for_run(client, thread.id, run.id)
+        
+        # Get the assistant's response
+        messages = await client.get_messages(thread.id)
+        latest_message = messages.data[0]  # Most recent message
+        return latest_message.content[0].text.value
+
+async def generate_batched(presentation):
+    """Generate every slide with a single structured-output request."""
+    client = AsyncOpenAI()
     
-    # Initialize the OpenAI client
-    client = AssistantsAPIClient()
+    # Pack all slide prompts into one message with clear delimiters
+    prompt = "Generate content for each of the following slides.\n"
+    for slide_type, variables in presentation.items():
+        prompt += f"\n### SLIDE: {slide_type}\n{generate_slide_prompt(slide_type, **variables)}\n"
     
+    response = await client.responses.create(
+        model=BATCH_MODEL,
+        instructions=INSTRUCTIONS,
+        input=prompt,
+        text={
+            "format": {
+                "type": "json_schema",
+                "name": "slides",
+                "schema": SLIDES_SCHEMA,
+                "strict": True
+            }
+        }
+    )
+    
+    slides = {
+        slide["slide_type"]: slide["content"]
+        for slide in json.loads(response.output_text)["slides"]
+    }
+    return [slides.get(slide_type, "") for slide_type in presentation]
+
+async def generate_with_assistants(client, presentation):
+    """Generate every slide through the Assistants API, one thread per slide."""
     # Create an assistant for slide generation
-    assistant = client.create_assistant(
+    assistant = await client.create_assistant(
         name="Slide Generator",
-        instructions="""
-        You are an expert presentation creator. Your task is to generate professional,
-        engaging, and well-structured slide content based on the provided prompts.
-        Follow these guidelines:
-        1. Keep content concise and impactful
-        2. Use clear and professional language
-        3. Maintain consistency in tone and style
-        4. Structure information logically
-        5. Highlight key points effectively
-        """
+        instructions=INSTRUCTIONS
     )
     
+    # Generate content for all slide types concurrently
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+    return await asyncio.gather(*(
+        generate_one(client, assistant.id, slide_type, variables, semaphore)
+        for slide_type, variables in presentation.items()
+    ))
+
+async def main():
+    # Load environment variables
+    load_dotenv()
+    
+    # Initialize the OpenAI client
+    client = OpenAIClient()
+    
     # Example presentation structure
     presentation = {
         'title': {
@@ -60,33 +167,18 @@ def main():
     }
     
     try:
-        # Create a new thread for the conversation
-        thread = client.create_thread()
+        # Generate all slides in one round trip, falling back to the
+        # Assistants API if the batched request fails
+        try:
+            results = await generate_batched(presentation)
+        except Exception as e:
+            print(f"Batched generation failed ({e}), falling back to Assistants API")
+            results = await generate_with_assistants(client, presentation)
         
-        # Generate content for each slide type
-        for slide_type, variables in presentation.items():
-            # Generate the prompt using our templates
-            prompt = generate_slide_prompt(slide_type, **variables)
-            
-            # Add the prompt to the thread
-            client.add_message(thread.id, prompt)
-            
-            # Run the assistant to generate content
-            run = client.run_assistant(thread.id, assistant.id)
-            
-            # Wait for completion and get the response
-            while True:
-                status = client.get_run_status(thread.id, run.id)
-                if status.status == 'completed':
-                    break
-            
-            # Get the assistant's response
-            messages = client.get_messages(thread.id)
-            latest_message = messages.data[0]  # Most recent message
-            
-            # Print the generated content
+        # Print the generated content
+        for slide_type, content in zip(presentation, results):
             print(f"\n=== {slide_type.upper()} SLIDE ===")
-            print(latest_message.content[0].text.value)
+            print(content)
             print("\n")
         
         # Print usage statistics
@@ -99,4 +191,4 @@ def main():
         print(f"Error: {e}")
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    asyncio.run(main())
\ No newline at end of file
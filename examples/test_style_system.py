@@ -22,14 +22,11 @@ def print_style_section(title, data):
     print(json.dumps(data, indent=2))
     print("=" * (len(title) + 8))
 
-def run_style_demo():
+def run_style_demo(style_manager):
     """Demonstrate the style inheritance features."""
     print("\n\nSTYLE INHERITANCE DEMO")
     print("=====================")
     
-    # Create StyleManager
-    style_manager = StyleManager()
-    
     # Get global styles
     global_styles = style_manager._global_styles
     print_style_section("Global Styles (Colors Only)", global_styles["colors"])
@@ -70,14 +67,11 @@ def run_style_demo():
     title_font = style_manager.get_specific_style("fonts.title", "minimal", "corporate")
     print(f"Title font for minimal+corporate: {title_font}")
 
-def run_brand_demo():
+def run_brand_demo(brand_manager):
     """Demonstrate the brand management features."""
     print("\n\nBRAND MANAGEMENT DEMO")
     print("====================")
     
-    # Create BrandManager
-    brand_manager = BrandManager()
-    
     # List available brands
     brands = brand_manager.get_brand_list()
     print(f"\nAvailable brands: {brands}")
@@ -104,14 +98,11 @@ def run_brand_demo():
     except KeyError:
         print("Failed to apply brand to template")
 
-def export_import_demo():
+def export_import_demo(style_manager, brand_manager):
     """Demonstrate export and import functionality."""
     print("\n\nEXPORT/IMPORT DEMO")
     print("=================")
     
-    # Create StyleManager
-    style_manager = StyleManager()
-    
     # Export corporate style to YAML
     export_path = style_manager.export_style_to_yaml("minimal", "corporate")
     print(f"\nExported style to: {export_path}")
@@ -142,8 +133,7 @@ def export_import_demo():
         }
     }
     
-    # Create brand manager and create the custom brand
-    brand_manager = BrandManager(style_manager=style_manager)
+    # Create the custom brand
     brand_manager.create_brand("custom", custom_brand)
     print("\nCreated custom brand")
     
@@ -156,10 +146,14 @@ def export_import_demo():
     print(f"\nExported custom brand to: {export_path}")
 
 if __name__ == "__main__":
+    # Load styles and brands once and share them across the demos
+    style_manager = StyleManager()
+    brand_manager = BrandManager(style_manager=style_manager)
+    
     # Run demonstrations
-    run_style_demo()
-    run_brand_demo()
-    export_import_demo()
+    run_style_demo(style_manager)
+    run_brand_demo(brand_manager)
+    export_import_demo(style_manager, brand_manager)
     
     print("\n\nDemo completed! 🎉")
     print("The style management system with brand guidelines integration is working properly.")
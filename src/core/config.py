@@ -3,22 +3,68 @@ Configuration management for the Automated Slide Creation System
 """
 
 import os
+from dataclasses import dataclass
+from typing import Optional
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
 load_dotenv()
 
+@dataclass(frozen=True, slots=True)
+class _Config:
+    """Immutable snapshot of API keys and application settings"""
+    
+    # API Keys
+    openai_api_key: Optional[str]
+    anthropic_api_key: Optional[str]
+    perplexity_api_key: Optional[str]
+    
+    # Application Settings
+    debug: bool
+    log_level: str
+    
+    # Cache parsed input files between runs
+    cache_enabled: bool
+    
+    @classmethod
+    def from_env(cls) -> "_Config":
+        """Build the configuration from environment variables"""
+        return cls(
+            openai_api_key=os.getenv('OPENAI_API_KEY'),
+            anthropic_api_key=os.getenv('ANTHROPIC_API_KEY'),
+            perplexity_api_key=os.getenv('PERPLEXITY_API_KEY'),
+            debug=os.getenv('DEBUG', 'False').lower() == 'true',
+            log_level=os.getenv('LOG_LEVEL', 'info').lower(),
+            cache_enabled=os.getenv('CACHE_ENABLED', 'False').lower() == 'true'
+        )
+    
+    def validate(self):
+        """Validate required configuration settings"""
+        if not self.openai_api_key:
+            raise ValueError("OPENAI_API_KEY must be set in environment variables")
+        
+        # Additional validation can be added here
+        
+        return True
+
+# Configuration loaded once at import time
+CONFIG = _Config.from_env()
+
 class Config:
-    """Configuration class for managing API keys and application settings"""
+    """Configuration class for managing API keys and application settings.
+    
+    Kept for backward compatibility; new code should use CONFIG.
+    """
     
     # API Keys
-    OPENAI_API_KEY = os.getenv('OPENAI_API_KEY')
-    ANTHROPIC_API_KEY = os.getenv('ANTHROPIC_API_KEY')
-    PERPLEXITY_API_KEY = os.getenv('PERPLEXITY_API_KEY')
+    OPENAI_API_KEY = CONFIG.openai_api_key
+    ANTHROPIC_API_KEY = CONFIG.anthropic_api_key
+    PERPLEXITY_API_KEY = CONFIG.perplexity_api_key
     
     # Application Settings
-    DEBUG = os.getenv('DEBUG', 'False').lower() == 'true'
-    LOG_LEVEL = os.getenv('LOG_LEVEL', 'info').lower()
+    DEBUG = CONFIG.debug
+    LOG_LEVEL = CONFIG.log_level
+    CACHE_ENABLED = CONFIG.cache_enabled
     
     @classmethod
     def validate(cls):
@@ -28,4 +74,4 @@ class Config:
         
         # Additional validation can be added here
         
-        return True 
\ No newline at end of file
+        return True
\ No newline at end of file
@@ -2,16 +2,82 @@
 Data input handlers for various file formats.
 """
 import logging
-import json
+import os
 import csv
-from typing import Dict, List, Any, Optional, Union
+import hashlib
+from functools import wraps
+from typing import Dict, List, Any, Iterator, Optional, Union
 from pathlib import Path
+import orjson
 import pandas as pd
+from .config import CONFIG
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Use ijson to stream large JSON arrays if available
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+# JSON arrays larger than this are streamed instead of loaded into memory
+JSON_STREAMING_THRESHOLD = 10 * 1024 * 1024
+
+# Location of cached parse results (enabled with CACHE_ENABLED=true)
+INPUT_CACHE_DIR = Path.home() / ".cache" / "presentation-creator" / "input"
+
+def _cache_dir_is_private() -> bool:
+    """Check that the input cache directory exists, is ours and is closed to other users."""
+    try:
+        st = INPUT_CACHE_DIR.stat()
+    except FileNotFoundError:
+        return False
+    if hasattr(os, 'getuid') and st.st_uid != os.getuid():
+        return False
+    return not st.st_mode & 0o077
+
+def cached_read(read_method):
+    """Decorator that memoizes a handler's read() result on disk.
+    
+    Results are keyed by the resolved input path, its modification time and
+    size, so any change to the file invalidates the cached entry. Entries are
+    stored as JSON in a directory only the current user can access, so a
+    cache file can at worst hold wrong data, never code.
+    """
+    @wraps(read_method)
+    def wrapper(self) -> Dict[str, Any]:
+        if not CONFIG.cache_enabled:
+            return read_method(self)
+            
+        cache_file = INPUT_CACHE_DIR / f"{self._cache_key()}.json"
+        private = _cache_dir_is_private()
+        if private and cache_file.exists():
+            try:
+                payload = cache_file.read_bytes()
+                return orjson.loads(payload)
+            except Exception as e:
+                logger.warning(f"Ignoring unreadable input cache {cache_file}: {e}")
+                
+        result = read_method(self)
+        
+        # Streamed results hold a lazy iterator and cannot be cached
+        if result["metadata"].get("streamed"):
+            return result
+            
+        try:
+            if not private:
+                INPUT_CACHE_DIR.mkdir(mode=0o700, parents=True, exist_ok=True)
+                if not _cache_dir_is_private():
+                    logger.warning(f"Not caching input: {INPUT_CACHE_DIR} is not private to this user")
+                    return result
+            cache_file.write_bytes(orjson.dumps(result))
+        except Exception as e:
+            logger.warning(f"Error writing input cache: {e}")
+            
+        return result
+    return wrapper
+
 class DataInputHandler:
     """Base class for handling data input from various file formats"""
     
@@ -22,7 +88,10 @@ class DataInputHandler:
             input_path: Path to the input file
         """
         self.input_path = Path(input_path)
-        if not self.input_path.exists():
+        # Stat once up front; read() reuses the result for file metadata
+        try:
+            self._stat = self.input_path.stat()
+        except FileNotFoundError:
             raise FileNotFoundError(f"Input file not found: {input_path}")
             
     def _validate_file_extension(self, expected_extensions: List[str]) -> None:
@@ -40,6 +109,20 @@ class DataInputHandler:
                 f"got {self.input_path.suffix}"
             )
             
+    def _cache_key(self) -> str:
+        """Build the cache key identifying this exact version of the input file.
+        
+        Returns:
+            Hex digest of the handler type, resolved path, mtime and size
+        """
+        key = (
+            type(self).__name__,
+            str(self.input_path.resolve()),
+            self._stat.st_mtime_ns,
+            self._stat.st_size
+        )
+        return hashlib.sha1(repr(key).encode('utf-8')).hexdigest()
+        
     def read(self) -> Dict[str, Any]:
         """Read and parse the input file.
         
@@ -54,6 +137,7 @@ class DataInputHandler:
 class TextInputHandler(DataInputHandler):
     """Handler for text file input"""
     
+    @cached_read
     def read(self) -> Dict[str, Any]:
         """Read and parse a text file.
         
@@ -63,29 +147,43 @@ class TextInputHandler(DataInputHandler):
         self._validate_file_extension(['.txt', '.text'])
         
         try:
+            title = None
+            current: List[str] = []
+            sections: List[str] = []
+            line_count = 0
+            
+            # Single pass over the file: the first non-empty line is the title,
+            # blank lines separate the remaining content into sections
             with open(self.input_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+                for raw_line in f:
+                    line = raw_line.strip()
+                    if not line:
+                        if current:
+                            sections.append('\n'.join(current))
+                            current = []
+                        continue
+                        
+                    line_count += 1
+                    if title is None:
+                        title = line
+                    else:
+                        current.append(line)
+                        
+            if current:
+                sections.append('\n'.join(current))
                 
-            # First get all lines, removing empty ones
-            lines = [line.strip() for line in content.splitlines() if line.strip()]
-            if not lines:
+            if title is None:
                 raise ValueError("Empty text file")
-                
-            # First line is always the title
-            title = lines[0]
-            
-            # Rest of the content is split into sections by double newlines
-            remaining_content = '\n'.join(lines[1:])
-            sections = [s.strip() for s in remaining_content.split('\n\n') if s.strip()]
             
             return {
                 "type": "text",
                 "title": title,
                 "sections": sections,
                 "metadata": {
-                    "file_size": self.input_path.stat().st_size,
-                    "line_count": len(lines),
-                    "section_count": len(sections)
+                    "file_size": self._stat.st_size,
+                    "line_count": line_count,
+                    # The title counts as the first section
+                    "section_count": len(sections) + 1
                 }
             }
         except Exception as e:
@@ -95,19 +193,21 @@ class TextInputHandler(DataInputHandler):
 class CSVInputHandler(DataInputHandler):
     """Handler for CSV file input"""
     
+    @cached_read
     def read(self) -> Dict[str, Any]:
         """Read and parse a CSV file.
         
+        Rows are kept exactly as written: headers are not renamed and rows
+        with more or fewer cells than the header are returned unchanged.
+        
         Returns:
             Dictionary containing the parsed CSV data with headers and rows
         """
         self._validate_file_extension(['.csv'])
         
         try:
-            rows = []
-            headers = []
-            
-            with open(self.input_path, 'r', encoding='utf-8') as f:
+            # The csv module's C parser, read in one pass without padding or truncating rows
+            with open(self.input_path, 'r', encoding='utf-8', newline='') as f:
                 reader = csv.reader(f)
                 headers = next(reader)  # First row as headers
                 rows = list(reader)
@@ -117,7 +217,7 @@ class CSVInputHandler(DataInputHandler):
                 "headers": headers,
                 "rows": rows,
                 "metadata": {
-                    "file_size": self.input_path.stat().st_size,
+                    "file_size": self._stat.st_size,
                     "row_count": len(rows),
                     "column_count": len(headers)
                 }
@@ -129,21 +229,71 @@ class CSVInputHandler(DataInputHandler):
 class JSONInputHandler(DataInputHandler):
     """Handler for JSON file input"""
     
+    def _is_top_level_array(self) -> bool:
+        """Check whether the JSON document is an array without parsing it."""
+        with open(self.input_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(4096), b''):
+                stripped = chunk.lstrip()
+                if stripped:
+                    # Skip a UTF-8 byte order mark if present
+                    return stripped.lstrip(b'\xef\xbb\xbf')[:1] == b'['
+        return False
+        
+    def iter_items(self, prefix: str = 'item') -> Iterator[Any]:
+        """Iterate over the items of a JSON document without loading it all at once.
+        
+        Args:
+            prefix: ijson prefix of the items to yield ('item' yields the
+                    elements of a top-level array)
+                    
+        Yields:
+            Parsed items one at a time
+        """
+        if IJSON_AVAILABLE:
+            with open(self.input_path, 'rb') as f:
+                yield from ijson.items(f, prefix)
+            return
+            
+        # Without ijson, fall back to a full parse
+        data = orjson.loads(self.input_path.read_bytes())
+        for key in prefix.split('.'):
+            if key == 'item':
+                break
+            data = data[key]
+        yield from data
+        
+    @cached_read
     def read(self) -> Dict[str, Any]:
         """Read and parse a JSON file.
         
         Returns:
-            Dictionary containing the parsed JSON data
+            Dictionary containing the parsed JSON data. Arrays larger than
+            JSON_STREAMING_THRESHOLD are returned as a lazy iterator when
+            ijson is installed (metadata["streamed"] is then True).
         """
         self._validate_file_extension(['.json'])
         
         try:
-            with open(self.input_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            # Stream large top-level arrays so memory stays bounded by one record
+            if (IJSON_AVAILABLE and self._stat.st_size > JSON_STREAMING_THRESHOLD
+                    and self._is_top_level_array()):
+                return {
+                    "type": "json",
+                    "data": self.iter_items(),
+                    "metadata": {
+                        "file_size": self._stat.st_size,
+                        "is_array": True,
+                        "top_level_keys": None,
+                        "array_length": None,
+                        "streamed": True
+                    }
+                }
+                
+            data = orjson.loads(self.input_path.read_bytes())
                 
             # Add metadata about the structure
             metadata = {
-                "file_size": self.input_path.stat().st_size,
+                "file_size": self._stat.st_size,
                 "is_array": isinstance(data, list),
                 "top_level_keys": list(data.keys()) if isinstance(data, dict) else None,
                 "array_length": len(data) if isinstance(data, list) else None
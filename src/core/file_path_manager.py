@@ -3,19 +3,74 @@ Module for managing file paths, names, and overwrite protection for presentation
 """
 import os
 import re
+import time
+import threading
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Union, Set
+from typing import Optional, Union, FrozenSet
+
+# Windows reserved names (case-insensitive)
+WINDOWS_RESERVED_NAMES: FrozenSet[str] = frozenset({
+    'con', 'prn', 'aux', 'nul',
+    'com1', 'com2', 'com3', 'com4', 'com5', 'com6', 'com7', 'com8', 'com9',
+    'lpt1', 'lpt2', 'lpt3', 'lpt4', 'lpt5', 'lpt6', 'lpt7', 'lpt8', 'lpt9'
+})
+
+# Pattern used by sanitize_filename
+_TRAVERSAL_RE = re.compile(r'\.\.[/\\]')
+
+# Path separators and other invalid characters, all replaced with '_'
+_INVALID_TABLE = str.maketrans({c: '_' for c in '<>:"|?*/\\'})
+
+# Last formatted timestamp as [epoch second, formatted string]
+_LAST_STAMP = [0, '']
+_STAMP_LOCK = threading.Lock()
+
+def _now_stamp() -> str:
+    """Return the current time as '%Y%m%d_%H%M%S', formatting at most once per second."""
+    t = int(time.time())
+    with _STAMP_LOCK:
+        if t != _LAST_STAMP[0]:
+            _LAST_STAMP[0] = t
+            _LAST_STAMP[1] = datetime.fromtimestamp(t).strftime('%Y%m%d_%H%M%S')
+        return _LAST_STAMP[1]
+
+@lru_cache(maxsize=4096)
+def _sanitize_filename(filename: str) -> str:
+    """Cached implementation of FilePathManager.sanitize_filename."""
+    # Handle empty or dot-only filenames first
+    if not filename or all(c == '.' for c in filename):
+        return 'presentation'
+        
+    # Replace path traversal patterns with underscores
+    # Replace each '../' or '..\\' with '___'
+    sanitized = _TRAVERSAL_RE.sub('___', filename)
+    # Replace remaining path separators and other invalid characters
+    sanitized = sanitized.translate(_INVALID_TABLE)
+    
+    # Remove leading/trailing spaces and dots
+    sanitized = sanitized.strip('. ')
+    
+    # Check again for empty or dot-only filename after sanitization
+    if not sanitized or all(c == '.' for c in sanitized):
+        return 'presentation'
+        
+    # Handle Windows reserved names
+    name_parts = sanitized.split('.')
+    name_base = name_parts[0].lower()
+    if name_base in WINDOWS_RESERVED_NAMES:
+        if len(name_parts) > 1:
+            sanitized = f"_{name_parts[0]}.{'.'.join(name_parts[1:])}"
+        else:
+            sanitized = f"_{sanitized}"
+        
+    return sanitized
 
 class FilePathManager:
     """Handles file path operations, name generation, and overwrite protection."""
     
-    # Windows reserved names (case-insensitive)
-    WINDOWS_RESERVED_NAMES: Set[str] = {
-        'con', 'prn', 'aux', 'nul',
-        'com1', 'com2', 'com3', 'com4', 'com5', 'com6', 'com7', 'com8', 'com9',
-        'lpt1', 'lpt2', 'lpt3', 'lpt4', 'lpt5', 'lpt6', 'lpt7', 'lpt8', 'lpt9'
-    }
+    WINDOWS_RESERVED_NAMES: FrozenSet[str] = WINDOWS_RESERVED_NAMES
     
     def __init__(self, base_dir: Optional[Union[str, Path]] = None):
         """
@@ -36,40 +91,7 @@ class FilePathManager:
         Returns:
             Sanitized filename
         """
-        # Handle empty or dot-only filenames first
-        if not filename or all(c == '.' for c in filename):
-            return 'presentation'
-            
-        # Replace path traversal patterns with underscores
-        # Replace each '../' or '..\\' with '___'
-        sanitized = re.sub(r'\.\.[/\\]', '___', filename)
-        # Replace remaining path separators
-        sanitized = re.sub(r'[/\\]', '_', sanitized)
-        
-        # Remove any remaining path-like components
-        sanitized = os.path.basename(sanitized)
-        
-        # Replace other invalid characters
-        invalid_chars = r'[<>:"|?*]'
-        sanitized = re.sub(invalid_chars, '_', sanitized)
-        
-        # Remove leading/trailing spaces and dots
-        sanitized = sanitized.strip('. ')
-        
-        # Check again for empty or dot-only filename after sanitization
-        if not sanitized or all(c == '.' for c in sanitized):
-            return 'presentation'
-            
-        # Handle Windows reserved names
-        name_parts = sanitized.split('.')
-        name_base = name_parts[0].lower()
-        if name_base in self.WINDOWS_RESERVED_NAMES:
-            if len(name_parts) > 1:
-                sanitized = f"_{name_parts[0]}.{'.'.join(name_parts[1:])}"
-            else:
-                sanitized = f"_{sanitized}"
-            
-        return sanitized
+        return _sanitize_filename(filename)
         
     def generate_timestamped_filename(self, base_name: str, extension: str = '.pptx') -> str:
         """
@@ -86,7 +108,7 @@ class FilePathManager:
         base_name = self.sanitize_filename(base_name)
         
         # Add timestamp
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        timestamp = _now_stamp()
         
         # Ensure extension starts with dot
         if not extension.startswith('.'):
@@ -120,22 +142,40 @@ class FilePathManager:
         if strategy == 'timestamp':
             # Add timestamp before extension
             stem = filepath.stem
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+            timestamp = _now_stamp()
             return filepath.with_name(f"{stem}_{timestamp}{filepath.suffix}")
         else:  # increment
-            counter = 1
-            while True:
-                new_filepath = filepath.with_name(f"{filepath.stem}_{counter}{filepath.suffix}")
-                if not new_filepath.exists():
-                    return new_filepath
-                counter += 1
+            stem, suffix = filepath.stem, filepath.suffix
+            
+            def numbered(counter: int) -> Path:
+                return filepath.with_name(f"{stem}_{counter}{suffix}")
+                
+            # Double the counter until we find a free slot, then binary search
+            # between the last taken and first free counter. Versions are
+            # created sequentially, so this finds the next number in O(log N)
+            # existence checks instead of O(N).
+            lo, hi = 0, 1
+            while numbered(hi).exists():
+                lo, hi = hi, hi * 2
                 
-    def validate_filepath(self, filepath: Union[str, Path]) -> None:
+            while hi - lo > 1:
+                mid = (lo + hi) // 2
+                if numbered(mid).exists():
+                    lo = mid
+                else:
+                    hi = mid
+                    
+            return numbered(hi)
+                
+    def validate_filepath(self, filepath: Union[str, Path], strict: bool = False) -> None:
         """
         Validate a filepath for writing.
         
         Args:
             filepath: The filepath to validate
+            strict: Probe write access by creating and removing the file instead of
+                    checking permissions with os.access, which can be inaccurate on
+                    some filesystems (NFS, ACLs)
             
         Raises:
             ValueError: If path is invalid
@@ -158,16 +198,18 @@ class FilePathManager:
         except OSError as e:
             raise OSError(f"Path too long or invalid: {e}")
             
-        # Check write permissions by trying to create a temp file
+        # Check write permissions
         if filepath.exists():
             if not os.access(filepath, os.W_OK):
                 raise PermissionError(f"No write permission for {filepath}")
-        else:
+        elif strict:
             try:
                 filepath.touch()
                 filepath.unlink()
             except OSError as e:
                 raise PermissionError(f"Cannot write to {filepath}: {e}")
+        elif not os.access(parent, os.W_OK):
+            raise PermissionError(f"Cannot write to {filepath}: parent directory is not writable")
                 
     def resolve_filepath(self, filename: str, create_dirs: bool = True) -> Path:
         """
@@ -0,0 +1,74 @@
+"""
+Response cache for deterministic LLM calls.
+
+Calls made at temperature 0 return the same output for the same model, system
+instructions and prompt, so their results can be reused instead of hitting the
+API again.
+"""
+import asyncio
+import hashlib
+import json
+import logging
+from collections import OrderedDict
+from typing import Any, Optional, Protocol
+
+logger = logging.getLogger(__name__)
+
+def make_cache_key(model: str, system: str, prompt: str) -> str:
+    """Build a cache key from the inputs that determine a deterministic response.
+
+    Args:
+        model: Model name
+        system: System instructions
+        prompt: User prompt
+
+    Returns:
+        Hex SHA-256 digest of the canonicalized inputs
+    """
+    payload = json.dumps({"m": model, "s": system, "p": prompt}, sort_keys=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+class LLMCache(Protocol):
+    """Interface for LLM response cache backends."""
+
+    async def get(self, key: str) -> Optional[Any]:
+        """Return the cached value for key, or None on a miss."""
+        ...
+
+    async def set(self, key: str, value: Any) -> None:
+        """Store value under key."""
+        ...
+
+class InMemoryLLMCache:
+    """In-process LRU cache for LLM responses."""
+
+    def __init__(self, max_size: int = 1024):
+        """Initialize the cache.
+
+        Args:
+            max_size: Maximum number of entries kept before the least recently used is evicted
+        """
+        self.max_size = max_size
+        self._entries: "OrderedDict[str, Any]" = OrderedDict()
+        self._lock = asyncio.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    async def get(self, key: str) -> Optional[Any]:
+        async with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            self.misses += 1
+            return None
+
+    async def set(self, key: str, value: Any) -> None:
+        async with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -4,60 +4,114 @@ OpenAI Assistants API client wrapper with error handling, rate limiting, and cac
 import os
 import time
 import json
+import hashlib
+import importlib
 import logging
-from typing import Any, Dict, Optional
+import random
+from collections import deque, OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
 from functools import wraps
 from pathlib import Path
+import httpx
 import openai
-from openai import OpenAI
-from tenacity import retry, stop_after_attempt, wait_exponential
+import orjson
+from openai import AsyncOpenAI
 import asyncio
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Run statuses after which a run will not change any more
+TERMINAL_RUN_STATUSES = frozenset({"completed", "failed", "cancelled", "expired", "incomplete"})
+
+# Package holding the SDK response models that may be rebuilt from the cache
+SDK_TYPES_PACKAGE = "openai.types."
+
+# Errors worth retrying: rate limits, network failures/timeouts and server errors
+RETRYABLE_ERRORS = (openai.RateLimitError, openai.APIConnectionError, openai.InternalServerError)
+
 class OpenAIRateLimiter:
     """Rate limiter for OpenAI API calls"""
     def __init__(self, max_requests: int = 50, time_window: int = 60):
         self.max_requests = max_requests
         self.time_window = time_window
-        self.requests = []
+        # Request times in ascending order; the oldest is evicted automatically when full
+        self.requests = deque(maxlen=max_requests)
+        self._lock = asyncio.Lock()
 
     async def wait_if_needed(self):
         """Wait if rate limit is reached"""
-        now = time.time()
-        # Remove old requests
-        self.requests = [req_time for req_time in self.requests if now - req_time < self.time_window]
-        
-        if len(self.requests) >= self.max_requests:
-            sleep_time = self.requests[0] + self.time_window - now
-            if sleep_time > 0:
-                logger.warning(f"Rate limit reached. Waiting {sleep_time:.2f} seconds")
-                await asyncio.sleep(sleep_time)
-            self.requests = self.requests[1:]
+        # Only the bookkeeping is done under the lock: each caller reserves the
+        # time slot it may send at, then sleeps without holding the lock so
+        # concurrent waiters are not serialized behind each other's sleeps.
+        async with self._lock:
+            now = time.monotonic()
+            # Remove old requests
+            while self.requests and now - self.requests[0] >= self.time_window:
+                self.requests.popleft()
+            
+            if len(self.requests) >= self.max_requests:
+                slot = self.requests[0] + self.time_window
+            else:
+                slot = now
+            self.requests.append(slot)
         
-        self.requests.append(now)
+        sleep_time = slot - now
+        if sleep_time > 0:
+            logger.warning(f"Rate limit reached. Waiting {sleep_time:.2f} seconds")
+            await asyncio.sleep(sleep_time)
 
 class ResponseCache:
-    """Cache for API responses"""
-    def __init__(self, cache_dir: str = ".cache"):
+    """Cache for API responses, with an in-memory LRU layer in front of the disk cache.
+    
+    Both layers hold serialized responses, so every hit returns a fresh object
+    and a caller mutating it can't corrupt later hits.
+    """
+    def __init__(self, cache_dir: str = ".cache", memory_size: int = 512):
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(exist_ok=True)
+        self.memory_size = memory_size
+        self._mem: "OrderedDict[str, bytes]" = OrderedDict()
+
+    @staticmethod
+    def _dumps(response: Dict[str, Any]) -> bytes:
+        """Serialize a response for storage"""
+        return orjson.dumps(response)
+
+    @staticmethod
+    def _loads(payload: bytes) -> Dict[str, Any]:
+        """Rebuild a response from its serialized form"""
+        return orjson.loads(payload)
+
+    def _remember(self, cache_key: str, payload: bytes) -> None:
+        """Store a serialized response in the in-memory layer, evicting the least recently used"""
+        self._mem[cache_key] = payload
+        self._mem.move_to_end(cache_key)
+        while len(self._mem) > self.memory_size:
+            self._mem.popitem(last=False)
 
     def _get_cache_key(self, prompt: str) -> str:
-        """Generate a cache key from the prompt"""
-        return str(hash(prompt))
+        """Generate a cache key from the prompt.
+        
+        Uses a content digest rather than hash(), which is randomized per process
+        and would make cached entries unreachable after a restart.
+        """
+        return hashlib.blake2b(prompt.encode('utf-8'), digest_size=16).hexdigest()
 
     def get(self, prompt: str) -> Optional[Dict[str, Any]]:
         """Get cached response for a prompt"""
         cache_key = self._get_cache_key(prompt)
+        if cache_key in self._mem:
+            self._mem.move_to_end(cache_key)
+            return self._loads(self._mem[cache_key])
+            
         cache_file = self.cache_dir / f"{cache_key}.json"
         
         if cache_file.exists():
             try:
-                with open(cache_file, 'r') as f:
-                    return json.load(f)
+                payload = cache_file.read_bytes()
+                response = self._loads(payload)
+                self._remember(cache_key, payload)
+                return response
             except Exception as e:
                 logger.error(f"Error reading cache: {e}")
                 return None
@@ -68,11 +122,18 @@ class ResponseCache:
         cache_key = self._get_cache_key(prompt)
         cache_file = self.cache_dir / f"{cache_key}.json"
         
+        # Write to a temp file and rename it into place so a crash mid-write
+        # can never leave a truncated entry behind
+        tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
         try:
-            with open(cache_file, 'w') as f:
-                json.dump(response, f)
+            # Serialize in one pass, shared by both layers, and write with a single call
+            payload = self._dumps(response)
+            self._remember(cache_key, payload)
+            tmp_file.write_bytes(payload)
+            os.replace(tmp_file, cache_file)
         except Exception as e:
             logger.error(f"Error writing cache: {e}")
+            tmp_file.unlink(missing_ok=True)
 
 class OpenAIClient:
     """OpenAI Assistants API client with error handling, rate limiting, and caching"""
@@ -84,7 +145,15 @@ class OpenAIClient:
         if not self.api_key:
             raise ValueError("OpenAI API key not provided")
             
-        self.client = OpenAI(api_key=self.api_key)
+        # One shared HTTP client with a pool large enough for concurrent calls,
+        # so connections (and TLS sessions) are reused instead of timing out
+        self._http = httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+            timeout=60
+        )
+        # The async client makes every API method awaitable, so network round
+        # trips no longer block the event loop
+        self.client = AsyncOpenAI(api_key=self.api_key, http_client=self._http)
         self.rate_limiter = OpenAIRateLimiter()
         self.cache = ResponseCache() if cache_enabled else None
         self.max_retries = max_retries
@@ -93,14 +162,109 @@ class OpenAIClient:
         self.total_tokens_used = 0
         self.total_api_calls = 0
 
-    @retry(stop=stop_after_attempt(3), 
-           wait=wait_exponential(multiplier=1, min=4, max=10))
-    async def _make_api_call(self, func, *args, **kwargs):
-        """Make an API call with retry logic"""
+    @staticmethod
+    def _get_call_cache_key(func, kwargs: Dict[str, Any]) -> str:
+        """Fingerprint an API call by the method called and its arguments"""
+        name = getattr(func, '__qualname__', repr(func))
+        return f"{name}:{json.dumps(kwargs, sort_keys=True, default=str)}"
+
+    @staticmethod
+    def _serialize_response(response: Any) -> Dict[str, Any]:
+        """Convert an SDK response into a JSON-serializable cache entry"""
+        if hasattr(response, 'model_dump'):
+            response_type = type(response)
+            return {
+                "type": f"{response_type.__module__}:{response_type.__qualname__}",
+                "data": response.model_dump(mode="json")
+            }
+        return {"type": None, "data": response}
+
+    @staticmethod
+    def _deserialize_response(entry: Dict[str, Any]) -> Any:
+        """Rebuild an SDK response from a cache entry.
+        
+        Only response models from openai.types are rebuilt, so a tampered
+        cache file can't make the client import or call anything else.
+        
+        Raises:
+            ValueError: If the entry names any other type
+        """
+        if not entry.get("type"):
+            return entry["data"]
+        module_name, qualname = entry["type"].split(":")
+        if not module_name.startswith(SDK_TYPES_PACKAGE):
+            raise ValueError(f"Refusing to rebuild cached response of type {entry['type']}")
+        response_type = importlib.import_module(module_name)
+        for attr in qualname.split("."):
+            response_type = getattr(response_type, attr)
+        if not (isinstance(response_type, type) and issubclass(response_type, openai.BaseModel)
+                and response_type.__module__.startswith(SDK_TYPES_PACKAGE)):
+            raise ValueError(f"Refusing to rebuild cached response of type {entry['type']}")
+        return response_type.model_validate(entry["data"])
+
+    @staticmethod
+    def _get_retry_delay(error: Exception, attempt: int, base_delay: float = 1.0,
+                         max_delay: float = 60.0) -> float:
+        """Work out how long to wait before retrying a failed call.
+        
+        Rate limit errors honor the server's Retry-After hint when present and
+        otherwise use exponential backoff plus jitter; other transient errors
+        use full jitter so concurrent callers don't retry in lockstep.
+        """
+        if isinstance(error, openai.RateLimitError):
+            headers = getattr(getattr(error, 'response', None), 'headers', None) or {}
+            for header, scale in (("retry-after-ms", 0.001), ("retry-after", 1.0)):
+                value = headers.get(header)
+                if value is not None:
+                    try:
+                        return min(float(value) * scale, max_delay)
+                    except (TypeError, ValueError):
+                        pass
+            return min(max_delay, base_delay * 2 ** attempt) + random.uniform(0, 1)
+        return random.uniform(0, min(max_delay, base_delay * 2 ** attempt))
+
+    async def _make_api_call(self, func, *args, cacheable: bool = False,
+                             max_attempts: Optional[int] = None, **kwargs):
+        """Make an API call, retrying transient failures.
+        
+        Calls are attempted up to max_attempts times, defaulting to the
+        client's max_retries.
+        """
+        max_attempts = max_attempts or self.max_retries
+        attempt = 0
+        while True:
+            try:
+                return await self._call_api(func, *args, cacheable=cacheable, **kwargs)
+            except RETRYABLE_ERRORS as e:
+                attempt += 1
+                if attempt >= max_attempts:
+                    raise
+                delay = self._get_retry_delay(e, attempt - 1)
+                logger.warning(f"Retrying API call in {delay:.2f}s (attempt {attempt + 1}/{max_attempts}): {e}")
+                await asyncio.sleep(delay)
+
+    async def _call_api(self, func, *args, cacheable: bool = False, **kwargs):
+        """Make a single API call.
+        
+        Calls marked cacheable are answered from the response cache when
+        possible, without consuming rate limit budget.
+        """
         try:
+            cache_key = None
+            if cacheable and self.cache and not args:
+                cache_key = self._get_call_cache_key(func, kwargs)
+                cached = self.cache.get(cache_key)
+                if cached is not None:
+                    try:
+                        return self._deserialize_response(cached)
+                    except Exception as e:
+                        logger.warning(f"Ignoring unusable cache entry: {e}")
+                        
             await self.rate_limiter.wait_if_needed()
             response = await func(*args, **kwargs)
             self.total_api_calls += 1
+            if cache_key is not None:
+                self.cache.set(cache_key, self._serialize_response(response))
             # Update token usage if available in response
             if hasattr(response, 'usage') and hasattr(response.usage, 'total_tokens'):
                 try:
@@ -110,7 +274,7 @@ class OpenAIClient:
                     pass
             return response
         except openai.RateLimitError:
-            logger.warning("Rate limit exceeded, retrying after exponential backoff")
+            logger.warning("Rate limit exceeded")
             raise
         except openai.APIError as e:
             logger.error(f"API error: {e}")
@@ -128,12 +292,41 @@ class OpenAIClient:
             model=model
         )
 
+    async def create_chat_completion(self, model: str, messages: List[Dict[str, Any]],
+                                     max_attempts: Optional[int] = None, **kwargs) -> Any:
+        """Create a chat completion
+        
+        Deterministic calls (temperature 0, not streamed) are served from the
+        response cache when an identical call was made before.
+        
+        Args:
+            model: Model name
+            messages: Chat messages
+            max_attempts: Attempts allowed for transient failures; defaults to the client's max_retries
+            **kwargs: Extra arguments for the completions endpoint
+        """
+        return await self._make_api_call(
+            self.client.chat.completions.create,
+            cacheable=kwargs.get("temperature") == 0 and not kwargs.get("stream"),
+            max_attempts=max_attempts,
+            model=model,
+            messages=messages,
+            **kwargs
+        )
+
     async def create_thread(self) -> Any:
         """Create a new thread"""
         return await self._make_api_call(
             self.client.beta.threads.create
         )
 
+    async def delete_thread(self, thread_id: str) -> Any:
+        """Delete a thread"""
+        return await self._make_api_call(
+            self.client.beta.threads.delete,
+            thread_id=thread_id
+        )
+
     async def add_message(self, thread_id: str, content: str, role: str = "user") -> Any:
         """Add a message to a thread"""
         return await self._make_api_call(
@@ -143,6 +336,18 @@ class OpenAIClient:
             content=content
         )
 
+    async def add_messages(self, thread_id: str, contents: List[str], role: str = "user") -> List[Any]:
+        """Add several messages to a thread concurrently.
+        
+        Returns:
+            One result per message, in order; failed calls are returned as the
+            exception instead of cancelling the others
+        """
+        return await asyncio.gather(
+            *(self.add_message(thread_id, content, role=role) for content in contents),
+            return_exceptions=True
+        )
+
     async def run_assistant(self, thread_id: str, assistant_id: str) -> Any:
         """Run an assistant on a thread"""
         return await self._make_api_call(
@@ -151,6 +356,20 @@ class OpenAIClient:
             assistant_id=assistant_id
         )
 
+    async def run_many(self, pairs: List[Tuple[str, str]]) -> List[Any]:
+        """Start assistant runs on several threads concurrently.
+        
+        Args:
+            pairs: (thread_id, assistant_id) tuples
+            
+        Returns:
+            One run (or exception) per pair, in order
+        """
+        return await asyncio.gather(
+            *(self.run_assistant(thread_id, assistant_id) for thread_id, assistant_id in pairs),
+            return_exceptions=True
+        )
+
     async def get_run_status(self, thread_id: str, run_id: str) -> Any:
         """Get the status of a run"""
         return await self._make_api_call(
@@ -159,6 +378,42 @@ class OpenAIClient:
             run_id=run_id
         )
 
+    async def wait_for_run(self, thread_id: str, run_id: str,
+                           initial_delay: float = 0.05, max_delay: float = 1.0,
+                           timeout: Optional[float] = None) -> Any:
+        """Poll a run until it reaches a terminal status.
+        
+        The delay between polls starts at initial_delay and doubles up to
+        max_delay, so short runs are picked up within tens of milliseconds
+        while long runs are still only checked about once a second.
+        
+        Args:
+            thread_id: Thread the run belongs to
+            run_id: Run to wait for
+            initial_delay: Delay before the second poll, in seconds
+            max_delay: Upper bound for the delay between polls, in seconds
+            timeout: Maximum total time to wait in seconds, or None to wait indefinitely
+        
+        Returns:
+            The final run object; callers should check its status
+            
+        Raises:
+            TimeoutError: If the run is still active after timeout seconds
+        """
+        async def poll() -> Any:
+            delay = initial_delay
+            while True:
+                run = await self.get_run_status(thread_id=thread_id, run_id=run_id)
+                if run.status in TERMINAL_RUN_STATUSES:
+                    return run
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, max_delay)
+                
+        try:
+            return await asyncio.wait_for(poll(), timeout=timeout)
+        except asyncio.TimeoutError:
+            raise TimeoutError(f"Run {run_id} did not finish within {timeout} seconds") from None
+
     async def get_messages(self, thread_id: str) -> Any:
         """Get messages from a thread"""
         return await self._make_api_call(
@@ -166,9 +421,16 @@ class OpenAIClient:
             thread_id=thread_id
         )
 
+    async def aclose(self) -> None:
+        """Close the underlying HTTP connection pool"""
+        await self._http.aclose()
+
     def get_token_usage(self) -> Dict[str, int]:
         """Get token usage statistics"""
         return {
             "total_tokens": self.total_tokens_used,
             "total_api_calls": self.total_api_calls
-        } 
\ No newline at end of file
+        }
+
+# Name used by earlier callers of the Assistants API wrapper
+AssistantsAPIClient = OpenAIClient
\ No newline at end of file
@@ -7,15 +7,14 @@ main pipeline implementation.
 """
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional, TypeVar, Generic
-from dataclasses import dataclass
+from typing import Any, Dict, List, Mapping, Optional, Tuple, TypeVar, Generic
+from dataclasses import dataclass, field
 from enum import Enum, auto
+from types import MappingProxyType
 import logging
 import asyncio
 from typing_extensions import Protocol
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 # Type variables for generic pipeline data
@@ -30,20 +29,29 @@ class PipelineStageStatus(Enum):
     FAILED = auto()
     SKIPPED = auto()
 
-@dataclass
+# Shared read-only default so results without metadata don't allocate a dict
+EMPTY_METADATA: Mapping[str, Any] = MappingProxyType({})
+
+@dataclass(slots=True)
 class StageResult(Generic[T]):
-    """Result of a pipeline stage execution."""
+    """Result of a pipeline stage execution.
+    
+    ``metadata`` defaults to a shared read-only mapping; to add entries,
+    assign a new dict (``result.metadata = {**result.metadata, key: value}``).
+    """
     status: PipelineStageStatus
     data: Optional[T] = None
     error: Optional[Exception] = None
-    metadata: Dict[str, Any] = None
-
-    def __post_init__(self):
-        if self.metadata is None:
-            self.metadata = {}
+    metadata: Mapping[str, Any] = field(default_factory=lambda: EMPTY_METADATA)
 
 class PipelineContext:
-    """Context object passed through the pipeline stages."""
+    """Context object passed through the pipeline stages.
+
+    Hot callers (error handlers, stage loops) may read ``_data`` directly
+    instead of going through ``get_data``.
+    """
+
+    __slots__ = ("start_time", "end_time", "_data", "errors")
     
     def __init__(self):
         self.start_time = None
@@ -66,11 +74,15 @@ class PipelineContext:
 class PipelineStage(Generic[T, U], ABC):
     """Abstract base class for pipeline stages."""
     
+    # Bumped whenever stages are linked, so pipelines know to rebuild their stage list
+    _links_version = 0
+    
     def __init__(self, name: str):
         self.name = name
         self._next_stages: List['PipelineStage'] = []
         self._error_handlers: List[callable] = []
         self._last_result = None
+        self.parallel_error_handlers = False
         
     @abstractmethod
     async def process(self, data: T, context: PipelineContext) -> StageResult[U]:
@@ -80,6 +92,8 @@ class PipelineStage(Generic[T, U], ABC):
     def add_next_stage(self, stage: 'PipelineStage') -> None:
         """Add a stage to be executed after this one."""
         self._next_stages.append(stage)
+        # Invalidates every pipeline's cached stage tuple
+        PipelineStage._links_version += 1
         
     def add_error_handler(self, handler: callable) -> None:
         """Add an error handler for this stage."""
@@ -88,9 +102,26 @@ class PipelineStage(Generic[T, U], ABC):
     async def handle_error(self, error: Exception, context: PipelineContext) -> Optional[Any]:
         """Handle an error that occurred during processing.
         
+        Handlers run one at a time and stop at the first recovery. Stages
+        whose handlers are side-effect-free can set parallel_error_handlers
+        to run them concurrently; the first non-None result in registration
+        order wins.
+        
         Returns:
             Optional[Any]: Recovery data if successful, None if no recovery was possible
         """
+        if self.parallel_error_handlers:
+            results = await asyncio.gather(
+                *(handler(error, context) for handler in self._error_handlers),
+                return_exceptions=True
+            )
+            for result in results:
+                if isinstance(result, Exception):
+                    logger.error(f"Error in error handler for stage {self.name}: {result}")
+                elif result is not None:
+                    return result
+            return None
+            
         for handler in self._error_handlers:
             try:
                 recovery_data = await handler(error, context)
@@ -107,6 +138,31 @@ class Pipeline:
         self.initial_stage = initial_stage
         self.context = PipelineContext()
         self._observers: List[callable] = []
+        self._stages: Tuple[PipelineStage, ...] = ()
+        self._stages_version = -1
+        
+    @property
+    def stages(self) -> Tuple[PipelineStage, ...]:
+        """The stages the pipeline executes, in order.
+        
+        Follows each stage's first next stage. Cached until stages are linked again.
+        """
+        if self._stages_version != PipelineStage._links_version:
+            self._stages = self._flatten_stages(self.initial_stage)
+            self._stages_version = PipelineStage._links_version
+        return self._stages
+        
+    @staticmethod
+    def _flatten_stages(initial_stage: PipelineStage) -> Tuple[PipelineStage, ...]:
+        """Follow the first-next-stage chain into a tuple of stages."""
+        stages = []
+        seen = set()
+        current = initial_stage
+        while current is not None and id(current) not in seen:
+            seen.add(id(current))
+            stages.append(current)
+            current = current._next_stages[0] if current._next_stages else None
+        return tuple(stages)
         
     def add_observer(self, observer: callable) -> None:
         """Add an observer to monitor pipeline execution."""
@@ -114,26 +170,34 @@ class Pipeline:
         
     async def _notify_observers(self, stage: PipelineStage, result: StageResult) -> None:
         """Notify observers of stage completion."""
-        for observer in self._observers:
-            try:
-                await observer(stage, result, self.context)
-            except Exception as e:
-                logger.error(f"Error in pipeline observer: {e}")
+        results = await asyncio.gather(
+            *(observer(stage, result, self.context) for observer in self._observers),
+            return_exceptions=True
+        )
+        for outcome in results:
+            if isinstance(outcome, Exception):
+                logger.error(f"Error in pipeline observer: {outcome}")
                 
     async def execute(self, initial_data: Any) -> PipelineContext:
         """Execute the pipeline with the given initial data."""
         self.context = PipelineContext()
-        current_stage = self.initial_stage
+        context_data = self.context._data
+        stages = self.stages
+        num_stages = len(stages)
+        log_info = logger.isEnabledFor(logging.INFO)
+        index = 0
         current_data = initial_data
         
         try:
-            while current_stage is not None:
-                logger.info(f"Executing pipeline stage: {current_stage.name}")
+            while index < num_stages:
+                current_stage = stages[index]
+                if log_info:
+                    logger.info(f"Executing pipeline stage: {current_stage.name}")
                 
                 try:
                     # Store current data in context for potential recovery
-                    self.context.set_data("stage_input_data", current_data)
-                    self.context.set_data("current_stage_name", current_stage.name)
+                    context_data["stage_input_data"] = current_data
+                    context_data["current_stage_name"] = current_stage.name
                     
                     result = await current_stage.process(current_data, self.context)
                     # Store the result for later reference
@@ -152,10 +216,7 @@ class Pipeline:
                     current_data = result.data
                     
                     # Move to the next stage if available
-                    if current_stage._next_stages:
-                        current_stage = current_stage._next_stages[0]
-                    else:
-                        current_stage = None
+                    index += 1
                         
                 except Exception as e:
                     logger.error(f"Error in pipeline stage {current_stage.name}: {e}")
@@ -6,17 +6,68 @@ the presentation generation pipeline stages.
 """
 
 import logging
-import traceback
 from typing import Any, Dict, Optional, List
 from pathlib import Path
-import json
 import asyncio
+import itertools
+import time
 from datetime import datetime
+import orjson
 
 from .pipeline import PipelineContext
 
 logger = logging.getLogger(__name__)
 
+# Write buffer size for checkpoint files, which can hold multi-MB partial results
+CHECKPOINT_BUFFER_SIZE = 256 * 1024
+
+# Checkpoint sequence shared by every AutoSaveStrategy so that handlers writing
+# to the same directory never collide. Seeded from the wall clock in
+# microseconds so numbering keeps increasing across runs.
+_CHECKPOINT_COUNTER = itertools.count(time.time_ns() // 1000)
+
+# Stage inputs larger than this (encoded) are recorded as a summary in
+# checkpoints unless the context sets "checkpoint_full"
+CHECKPOINT_INPUT_LIMIT = 1024 * 1024
+
+def _dumps(obj: Any, indent: bool = False) -> bytes:
+    """Encode an object as JSON bytes."""
+    option = orjson.OPT_NON_STR_KEYS
+    if indent:
+        option |= orjson.OPT_INDENT_2
+    return orjson.dumps(obj, option=option)
+
+def _estimate_json_size(obj: Any, limit: int) -> Optional[int]:
+    """Cheaply estimate the encoded JSON size of an object without encoding it.
+    
+    Stops walking as soon as the estimate passes limit.
+    
+    Returns:
+        Optional[int]: The estimated size, or None if the object holds values
+        that aren't plain JSON types
+    """
+    size = 0
+    pending = [obj]
+    while pending and size <= limit:
+        item = pending.pop()
+        if isinstance(item, str):
+            size += len(item) + 2
+        elif item is None or isinstance(item, (bool, int, float)):
+            size += 8
+        elif isinstance(item, dict):
+            size += 2 + 2 * len(item)
+            for key, value in item.items():
+                if not (key is None or isinstance(key, (str, bool, int, float))):
+                    return None
+                pending.append(key if isinstance(key, str) else str(key))
+                pending.append(value)
+        elif isinstance(item, (list, tuple)):
+            size += 2 + len(item)
+            pending.extend(item)
+        else:
+            return None
+    return size
+
 class ErrorRecoveryStrategy:
     """Base class for error recovery strategies."""
     
@@ -29,36 +80,41 @@ class ErrorRecoveryStrategy:
         raise NotImplementedError
 
 class RetryStrategy(ErrorRecoveryStrategy):
-    """Strategy that retries the operation with exponential backoff."""
+    """Strategy that retries the operation with exponential backoff.
+    
+    Retry counts live in the pipeline context, so they reset with every
+    execution and a strategy instance can be shared between pipelines.
+    """
     
     def __init__(self, max_retries: int = 3, initial_delay: float = 1.0):
         self.max_retries = max_retries
         self.initial_delay = initial_delay
-        self._retry_counts: Dict[str, int] = {}
         
     async def can_recover(self, error: Exception, context: PipelineContext) -> bool:
-        stage_name = context.get_data("current_stage_name")
-        current_retries = self._retry_counts.get(stage_name, 0)
+        data = context._data
+        current_retries = data.get(f"_retry:{data.get('current_stage_name')}", 0)
         return current_retries < self.max_retries
         
     async def recover(self, error: Exception, context: PipelineContext) -> Optional[Any]:
-        stage_name = context.get_data("current_stage_name")
-        current_retries = self._retry_counts.get(stage_name, 0)
-        self._retry_counts[stage_name] = current_retries + 1
+        data = context._data
+        stage_name = data.get("current_stage_name")
+        retry_key = f"_retry:{stage_name}"
+        current_retries = data.get(retry_key, 0)
+        data[retry_key] = current_retries + 1
         
         delay = self.initial_delay * (2 ** current_retries)
         logger.info(f"Retrying {stage_name} after {delay}s (attempt {current_retries + 1}/{self.max_retries})")
         await asyncio.sleep(delay)
         
         # Make sure we have the stage input data for the retry
-        input_data = context.get_data("stage_input_data")
+        input_data = data.get("stage_input_data")
         if input_data is None:
             logger.warning(f"No stage input data found for retry of {stage_name}")
             return None
             
         # Ensure we're setting up for a clean retry
-        context.set_data("retry_attempt", current_retries + 1)
-        context.set_data("recovery_strategy", self.__class__.__name__)
+        data["retry_attempt"] = current_retries + 1
+        data["recovery_strategy"] = self.__class__.__name__
         
         return input_data
 
@@ -67,32 +123,70 @@ class FallbackContentStrategy(ErrorRecoveryStrategy):
     
     def __init__(self, fallback_templates_dir: Path):
         self.fallback_templates_dir = fallback_templates_dir
+        # Index the available templates once so recovery never touches the
+        # filesystem for topics that have no template
+        self._available = {p.stem for p in fallback_templates_dir.glob("*.json")}
+        # Raw template bytes; each recovery parses its own copy so a stage that
+        # mutates the fallback content can't corrupt it for later runs
+        self._raw: Dict[str, bytes] = {}
         
     async def can_recover(self, error: Exception, context: PipelineContext) -> bool:
         return (
             isinstance(error, (ConnectionError, TimeoutError)) and
-            context.get_data("current_stage_name") == "Content Generation"
+            context._data.get("current_stage_name") == "Content Generation"
         )
         
     async def recover(self, error: Exception, context: PipelineContext) -> Optional[Dict[str, Any]]:
-        topic = context.get_data("topic")
-        template_path = self.fallback_templates_dir / f"{topic.lower().replace(' ', '_')}.json"
-        
-        if template_path.exists():
-            logger.info(f"Using fallback template for topic: {topic}")
-            return json.loads(template_path.read_text())
-        return None
+        topic = context._data.get("topic")
+        key = topic.lower().replace(' ', '_')
+        if key not in self._available:
+            return None
+            
+        raw = self._raw.get(key)
+        if raw is None:
+            raw = self._raw[key] = (self.fallback_templates_dir / f"{key}.json").read_bytes()
+        logger.info(f"Using fallback template for topic: {topic}")
+        return orjson.loads(raw)
 
 class AutoSaveStrategy(ErrorRecoveryStrategy):
     """Strategy that auto-saves progress and can resume from last checkpoint."""
     
-    def __init__(self, checkpoints_dir: Path):
+    def __init__(self, checkpoints_dir: Path, max_keep: int = 50):
         self.checkpoints_dir = checkpoints_dir
         self.checkpoints_dir.mkdir(parents=True, exist_ok=True)
+        self.max_keep = max_keep
         
     def _get_checkpoint_path(self, context: PipelineContext) -> Path:
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        return self.checkpoints_dir / f"checkpoint_{timestamp}.json"
+        # Zero-padded so lexical order matches creation order
+        return self.checkpoints_dir / f"checkpoint_{next(_CHECKPOINT_COUNTER):020d}.json"
+        
+    def _rotate_checkpoints(self) -> None:
+        """Delete the oldest checkpoints so at most max_keep remain."""
+        checkpoints = sorted(self.checkpoints_dir.glob("checkpoint_*.json"))
+        for old in checkpoints[:-self.max_keep]:
+            try:
+                old.unlink()
+            except FileNotFoundError:
+                pass
+        
+    def _capture_input(self, input_data: Any, full: bool) -> Any:
+        """Return the stage input as it should appear in a checkpoint.
+        
+        Inputs that are not plain JSON (e.g. raw image bytes) or whose estimated
+        size exceeds CHECKPOINT_INPUT_LIMIT are replaced by a small summary so
+        that repeated failures don't rewrite the same multi-MB payload to disk.
+        The size is estimated, not encoded, so the input is only serialized once,
+        as part of the checkpoint.
+        """
+        if full or input_data is None:
+            return input_data
+        if isinstance(input_data, (bytes, bytearray, memoryview)):
+            size = len(input_data)
+        else:
+            size = _estimate_json_size(input_data, CHECKPOINT_INPUT_LIMIT)
+            if size is not None and size <= CHECKPOINT_INPUT_LIMIT:
+                return input_data
+        return {"ref": id(input_data), "type": type(input_data).__name__, "size": size}
         
     async def can_recover(self, error: Exception, context: PipelineContext) -> bool:
         # Can always try to save progress
@@ -100,22 +194,27 @@ class AutoSaveStrategy(ErrorRecoveryStrategy):
         
     async def recover(self, error: Exception, context: PipelineContext) -> Optional[Any]:
         # Save current progress
+        data = context._data
+        input_data = data.get("stage_input_data")
         checkpoint_data = {
-            "stage_name": context.get_data("current_stage_name"),
-            "input_data": context.get_data("stage_input_data"),
-            "partial_results": context.get_data("partial_results", {}),
+            "stage_name": data.get("current_stage_name"),
+            "input_data": self._capture_input(input_data, data.get("checkpoint_full", False)),
+            "partial_results": data.get("partial_results", {}),
             "error": str(error),
             "timestamp": datetime.now().isoformat()
         }
         
         checkpoint_path = self._get_checkpoint_path(context)
-        checkpoint_path.write_text(json.dumps(checkpoint_data, indent=2))
+        payload = _dumps(checkpoint_data, indent=True)
+        with open(checkpoint_path, "wb", buffering=CHECKPOINT_BUFFER_SIZE) as f:
+            f.write(payload)
         logger.info(f"Saved checkpoint to: {checkpoint_path}")
+        self._rotate_checkpoints()
         
         # Return the input data so the pipeline can continue
         # This allows AutoSaveStrategy to be used alongside RetryStrategy
         # If RetryStrategy has already recovered, this won't be used
-        return context.get_data("stage_input_data")
+        return input_data
 
 class ErrorHandler:
     """Main error handler that coordinates recovery strategies."""
@@ -134,8 +233,10 @@ class ErrorHandler:
         Returns:
             Optional[Any]: Recovery data if successful, None if no recovery was possible
         """
-        logger.error(f"Error in stage {context.get_data('current_stage_name')}: {error}")
-        logger.error(f"Traceback:\n{''.join(traceback.format_tb(error.__traceback__))}")
+        if logger.isEnabledFor(logging.ERROR):
+            stage_name = context._data.get("current_stage_name")
+            # exc_info defers traceback formatting to the logging handlers
+            logger.error(f"Error in stage {stage_name}: {error}", exc_info=error)
         
         recovery_result = None
         
@@ -5,7 +5,7 @@ This module provides a factory class for constructing the presentation generatio
 pipeline with all its stages properly configured and connected.
 """
 
-from typing import Optional, Dict, Any
+from typing import Any, Callable, Dict, Optional, Set
 import logging
 from pathlib import Path
 
@@ -17,6 +17,7 @@ from .presentation_pipeline_stages import (
     PresentationAssemblyStage
 )
 from .pipeline_error_handlers import (
+    ErrorHandler,
     create_input_validation_error_handler,
     create_content_generation_error_handler,
     create_slide_creation_error_handler,
@@ -24,34 +25,102 @@ from .pipeline_error_handlers import (
 )
 from .data_input_handler import DataInputHandler
 from .openai_client import OpenAIClient
+from .llm_cache import InMemoryLLMCache, LLMCache
 from .slide_content_generator import SlideContentGenerator
 from .slide_generator import SlideGenerator
-from .theme_manager import ThemeManager
 from .presentation_builder import PresentationBuilder
 from ..presentation.presentation_finalizer import PresentationFinalizer
 
 logger = logging.getLogger(__name__)
 
+# Context key each stage records its completion time under
+STAGE_TIME_KEYS = {
+    "Input Validation": "input_validation_time",
+    "Content Generation": "content_generation_time",
+    "Slide Creation": "slide_creation_time",
+    "Presentation Assembly": "assembly_time"
+}
+
 class PipelineFactory:
     """Factory class for creating presentation generation pipelines."""
     
-    def __init__(self, base_dir: Optional[Path] = None, input_path: Optional[Path] = None):
-        # Initialize component instances
+    __slots__ = (
+        "input_handler", "_openai_client", "llm_cache", "_content_generator",
+        "_presentation_builder", "base_dir", "checkpoints_dir",
+        "fallback_templates_dir", "_error_handlers"
+    )
+    
+    # Directories already created by an earlier factory in this process
+    _dirs_created: Set[Path] = set()
+    
+    def __init__(self, base_dir: Optional[Path] = None, input_path: Optional[Path] = None,
+                 openai_client: Optional[OpenAIClient] = None, llm_cache: Optional[LLMCache] = None):
+        """
+        Initialize the factory and the components shared by its pipelines.
+        
+        Args:
+            base_dir: Directory for checkpoints and fallback templates (defaults to cwd)
+            input_path: Optional path to an input data file
+            openai_client: Optional OpenAIClient to reuse, so callers creating several
+                factories share one connection pool, rate limiter and response cache
+            llm_cache: Optional slide content cache to reuse across factories; defaults
+                to a new in-process LRU cache
+        """
         self.input_handler = DataInputHandler(input_path) if input_path else None
-        self.openai_client = OpenAIClient()
-        self.content_generator = SlideContentGenerator(openai_client=self.openai_client)
-        self.slide_generator = SlideGenerator()
-        self.theme_manager = ThemeManager()
-        self.presentation_builder = PresentationBuilder(openai_client=self.openai_client)
+        # Components are built on first use (see the properties below)
+        self._openai_client = openai_client
+        self.llm_cache = llm_cache if llm_cache is not None else InMemoryLLMCache()
+        self._content_generator: Optional[SlideContentGenerator] = None
+        self._presentation_builder: Optional[PresentationBuilder] = None
         
         # Set up error handling directories
         self.base_dir = base_dir or Path.cwd()
         self.checkpoints_dir = self.base_dir / "checkpoints"
         self.fallback_templates_dir = self.base_dir / "templates" / "fallback"
         
-        # Create directories if they don't exist
-        self.checkpoints_dir.mkdir(parents=True, exist_ok=True)
-        self.fallback_templates_dir.mkdir(parents=True, exist_ok=True)
+        # Create directories if they don't exist, once per process
+        for directory in (self.checkpoints_dir, self.fallback_templates_dir):
+            if directory not in PipelineFactory._dirs_created:
+                directory.mkdir(parents=True, exist_ok=True)
+                PipelineFactory._dirs_created.add(directory)
+        
+        # Error handlers keep their per-run state in the pipeline context, so one
+        # set can serve every pipeline this factory creates
+        self._error_handlers = {
+            "Input Validation": create_input_validation_error_handler(self.checkpoints_dir),
+            "Content Generation": create_content_generation_error_handler(
+                self.checkpoints_dir,
+                self.fallback_templates_dir
+            ),
+            "Slide Creation": create_slide_creation_error_handler(self.checkpoints_dir),
+            "Presentation Assembly": create_presentation_assembly_error_handler(self.checkpoints_dir)
+        }
+        
+    # One instance of each component, shared by the stages and the builder.
+    # Slide generators hold the deck being built, so they are never shared.
+    @property
+    def openai_client(self) -> OpenAIClient:
+        """The OpenAI client, created on first access."""
+        if self._openai_client is None:
+            self._openai_client = OpenAIClient()
+        return self._openai_client
+        
+    @property
+    def content_generator(self) -> SlideContentGenerator:
+        """The slide content generator, created on first access."""
+        if self._content_generator is None:
+            self._content_generator = SlideContentGenerator(
+                openai_client=self.openai_client,
+                cache=self.llm_cache
+            )
+        return self._content_generator
+        
+    @property
+    def presentation_builder(self) -> PresentationBuilder:
+        """The presentation builder, created on first access with its own slide generator."""
+        if self._presentation_builder is None:
+            self._presentation_builder = PresentationBuilder(content_generator=self.content_generator)
+        return self._presentation_builder
         
     async def create_pipeline(self, config: Optional[Dict[str, Any]] = None) -> Pipeline:
         """
@@ -66,7 +135,9 @@ class PipelineFactory:
         # Create pipeline stages
         input_stage = InputValidationStage(self.input_handler)
         content_stage = ContentGenerationStage(self.openai_client, self.content_generator)
-        slide_stage = SlideCreationStage(self.slide_generator, self.theme_manager)
+        # The stage builds slides into its own deck, separate from the builder's
+        slide_generator = SlideGenerator()
+        slide_stage = SlideCreationStage(slide_generator, slide_generator.theme_manager)
         assembly_stage = PresentationAssemblyStage(
             self.presentation_builder
         )
@@ -94,37 +165,33 @@ class PipelineFactory:
     def _add_error_handlers(self, pipeline: Pipeline) -> None:
         """Add stage-specific error handlers to all stages."""
         stages = self._get_all_stages(pipeline)
-        
-        # Create error handlers for each stage
-        handlers = {
-            "Input Validation": create_input_validation_error_handler(self.checkpoints_dir),
-            "Content Generation": create_content_generation_error_handler(
-                self.checkpoints_dir,
-                self.fallback_templates_dir
-            ),
-            "Slide Creation": create_slide_creation_error_handler(self.checkpoints_dir),
-            "Presentation Assembly": create_presentation_assembly_error_handler(self.checkpoints_dir)
-        }
+        handlers = self._error_handlers
         
         # Add error handlers to stages
         for stage in stages:
             if stage.name in handlers:
-                async def create_handler(stage_handler):
-                    async def error_handler(error: Exception, context: Any) -> None:
-                        context.set_data("current_stage_name", stage.name)
-                        result = await stage_handler.handle_error(error, context)
-                        if result is not None:
-                            context.set_data("stage_input_data", result)
-                    return error_handler
-                
-                stage.add_error_handler(create_handler(handlers[stage.name]))
+                stage.add_error_handler(self._make_error_handler(stage.name, handlers[stage.name]))
+    
+    @staticmethod
+    def _make_error_handler(stage_name: str, stage_handler: ErrorHandler) -> Callable:
+        """Wrap an ErrorHandler as a stage error handler bound to one stage name."""
+        async def error_handler(error: Exception, context: Any) -> Optional[Any]:
+            context.set_data("current_stage_name", stage_name)
+            result = await stage_handler.handle_error(error, context)
+            if result is not None:
+                context.set_data("stage_input_data", result)
+            return result
+        return error_handler
     
     def _add_performance_monitoring(self, pipeline: Pipeline) -> None:
         """Add performance monitoring to the pipeline."""
         async def performance_observer(stage: Any, result: Any, context: Any) -> None:
-            stage_time = context.get_data(f"{stage.name.lower()}_time")
+            key = STAGE_TIME_KEYS.get(stage.name)
+            if key is None or not logger.isEnabledFor(logging.INFO):
+                return
+            stage_time = context.get_data(key)
             if stage_time:
-                logger.info(f"Stage {stage.name} completed at {stage_time}")
+                logger.info("Stage %s completed at %s", stage.name, stage_time)
                 
         pipeline.add_observer(performance_observer)
     
@@ -146,12 +213,7 @@ class PipelineFactory:
     
     def _get_all_stages(self, pipeline: Pipeline) -> list:
         """Get all stages in the pipeline."""
-        stages = []
-        current = pipeline.initial_stage
-        while current:
-            stages.append(current)
-            current = current._next_stages[0] if current._next_stages else None
-        return stages
+        return list(pipeline.stages)
 
 # Example usage:
 async def create_default_pipeline() -> Pipeline:
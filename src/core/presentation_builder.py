@@ -3,25 +3,51 @@ Presentation builder that combines slide content generation and slide creation.
 """
 import logging
 import asyncio
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from pathlib import Path
 from .slide_content_generator import SlideContentGenerator
 from .slide_generator import SlideGenerator
 from .theme_manager import ThemeManager
 from ..presentation.presentation_exporter import PresentationExporter
 from .openai_client import OpenAIClient
+from .llm_cache import InMemoryLLMCache, LLMCache
 from ..utils.text_parser import TextParser
 from ..utils.content_mapper import ContentMapper
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Largest text/markdown file build_presentation_from_text_file will load
+MAX_TEXT_FILE_SIZE = 50 * 1024 * 1024
+
 class PresentationBuilder:
     """Builds complete presentations by combining content generation and slide creation."""
     
+    __slots__ = (
+        "content_generator", "slide_generator", "text_parser", "content_mapper",
+        "_content_mapper_density", "_template_info_cache"
+    )
+    
+    # Map template types to SlideGenerator creation methods
+    SLIDE_CREATORS = SlideGenerator.SLIDE_CREATORS
+    
+    # Map text format types to TextParser methods
+    TEXT_PARSERS = {
+        None: "parse_auto",
+        "markdown": "parse_markdown",
+        "text": "parse",
+    }
+    
+    # Map file extensions to text format types (anything else is plain text)
+    EXTENSION_FORMATS = {
+        ".md": "markdown",
+        ".markdown": "markdown",
+    }
+    
     def __init__(self, openai_client: Optional[OpenAIClient] = None, api_key: Optional[str] = None,
-                 template_path: Optional[str] = None, custom_theme: Optional[Dict[str, Any]] = None):
+                 template_path: Optional[str] = None, custom_theme: Optional[Dict[str, Any]] = None,
+                 content_generator: Optional[SlideContentGenerator] = None,
+                 slide_generator: Optional[SlideGenerator] = None,
+                 llm_cache: Optional[LLMCache] = None):
         """Initialize the presentation builder.
         
         Args:
@@ -30,16 +56,45 @@ class PresentationBuilder:
                     will use environment variable.
             template_path: Optional path to PowerPoint template
             custom_theme: Optional custom theme settings
+            content_generator: Optional existing SlideContentGenerator to share. When given,
+                    openai_client and api_key are ignored.
+            slide_generator: Optional existing SlideGenerator to share. When given,
+                    template_path and custom_theme are ignored.
+            llm_cache: Optional slide content cache for the content generator created here;
+                    defaults to a new in-process LRU cache. Ignored with content_generator.
         """
-        self.content_generator = SlideContentGenerator(openai_client=openai_client, api_key=api_key)
-        self.slide_generator = SlideGenerator(template_path=template_path, custom_theme=custom_theme)
+        self.content_generator = content_generator or SlideContentGenerator(
+            openai_client=openai_client, api_key=api_key,
+            cache=llm_cache if llm_cache is not None else InMemoryLLMCache()
+        )
+        self.slide_generator = slide_generator or SlideGenerator(
+            template_path=template_path, custom_theme=custom_theme
+        )
         self.text_parser = TextParser()
         self.content_mapper = ContentMapper()
+        self._content_mapper_density = "medium"
+        self._template_info_cache: Optional[Tuple[Tuple[int, ...], Dict[str, Any]]] = None
         
     async def initialize(self) -> None:
         """Initialize the content generator."""
         await self.content_generator.initialize()
         
+    def _create_slide(self, content: Dict[str, Any]) -> None:
+        """Add a slide for one successfully generated content entry.
+        
+        Args:
+            content: Content entry produced by the content generator, without an "error" key
+        """
+        try:
+            template_type = content["type"]
+            creator_name = self.SLIDE_CREATORS.get(template_type)
+            if creator_name is None:
+                logger.warning(f"Unknown template type: {template_type}")
+                return
+            getattr(self.slide_generator, creator_name)(content["content"])
+        except Exception as e:
+            logger.error(f"Error creating slide: {e}")
+            
     async def build_presentation(self, 
                                slide_specs: List[Dict[str, Any]], 
                                output_path: str,
@@ -58,38 +113,37 @@ class PresentationBuilder:
             - path: Path where presentation was saved
             - file_info: Information about the saved file
         """
-        # Generate content for all slides
-        generated_contents = await self.content_generator.generate_multiple_slides(
-            slide_specs, max_retries=max_retries
-        )
-        
-        # Create slides using the generated content
-        for content in generated_contents:
-            if "error" in content:
-                logger.error(f"Error in slide content generation: {content['error']}")
-                continue
-                
-            try:
-                # Map template types to slide creation methods
-                template_type = content["type"]
-                if template_type == "title":
-                    self.slide_generator.create_title_slide(content["content"])
-                elif template_type == "content":
-                    self.slide_generator.create_content_slide(content["content"])
-                elif template_type == "section_transition":
-                    self.slide_generator.create_section_transition(content["content"])
-                elif template_type == "summary":
-                    self.slide_generator.create_summary_slide(content["content"])
-                else:
-                    logger.warning(f"Unknown template type: {template_type}")
-            except Exception as e:
-                logger.error(f"Error creating slide: {e}")
+        # Slide creation is blocking python-pptx work, so it runs in a worker thread
+        # while the next slide's content is generated. Each step waits for the one
+        # before it, which keeps slides in order and the Presentation single-threaded.
+        # Failed slides are filtered out here and reported in a single log record.
+        content_errors = []
+        previous: Optional[asyncio.Task] = None
+        try:
+            async for content in self.content_generator.iter_slide_contents(
+                slide_specs, max_retries=max_retries
+            ):
+                error = content.get("error")
+                if error is not None:
+                    content_errors.append(error)
+                    continue
+                if previous is not None:
+                    await previous
+                previous = asyncio.create_task(asyncio.to_thread(self._create_slide, content))
+        finally:
+            if previous is not None:
+                await previous
+            
+        if content_errors:
+            logger.error("Error in slide content generation for %d slides: %s",
+                         len(content_errors), content_errors)
                 
         # Export the presentation
         try:
+            # Serializing the OOXML package is blocking disk I/O, so keep it off the event loop
             exporter = PresentationExporter(self.slide_generator.prs)
-            actual_path = exporter.export(output_path, export_options)
-            file_info = exporter.get_file_info(actual_path)
+            actual_path = await asyncio.to_thread(exporter.export, output_path, export_options)
+            file_info = await asyncio.to_thread(exporter.get_file_info, actual_path)
             logger.info(f"Presentation saved to {actual_path}")
             return {
                 'path': actual_path,
@@ -121,10 +175,8 @@ class PresentationBuilder:
             - path: Path where presentation was saved
             - file_info: Information about the saved file
         """
-        slide_specs = []
-        
         # Add title slide
-        slide_specs.append({
+        slide_specs = [{
             "template_type": "title",
             "variables": {
                 "title": title,
@@ -132,37 +184,49 @@ class PresentationBuilder:
                 "presenter": presenter,
                 "date": date
             }
-        })
+        }]
+        
+        # Title of the section that follows each section, computed once
+        next_titles = [section["title"] for section in outline[1:]]
+        next_titles.append("Summary")
+        main_topics = []
+        key_takeaways = []
         
         # Process each section
         for i, section in enumerate(outline):
+            main_topics.append(section["title"])
+            if "key_takeaway" in section:
+                key_takeaways.append(section["key_takeaway"])
+                
             # Add section transition if not first section
             if i > 0:
                 slide_specs.append({
                     "template_type": "section_transition",
                     "variables": {
                         "current_section": section["title"],
-                        "next_section": outline[i + 1]["title"] if i + 1 < len(outline) else "Summary"
+                        "next_section": next_titles[i]
                     }
                 })
                 
             # Add content slides for the section
-            for content in section["content"]:
-                slide_specs.append({
+            slide_specs.extend(
+                {
                     "template_type": "content",
                     "variables": {
                         "title": content["title"],
                         "key_points": content["points"],
                         "context": content.get("context", "")
                     }
-                })
+                }
+                for content in section["content"]
+            )
                 
         # Add summary slide
         slide_specs.append({
             "template_type": "summary",
             "variables": {
-                "main_topics": [section["title"] for section in outline],
-                "key_takeaways": [section["key_takeaway"] for section in outline if "key_takeaway" in section]
+                "main_topics": main_topics,
+                "key_takeaways": key_takeaways
             }
         })
         
@@ -193,17 +257,16 @@ class PresentationBuilder:
             - path: Path where presentation was saved
             - file_info: Information about the saved file
         """
-        # Initialize the content mapper with the specified density
-        self.content_mapper = ContentMapper(content_density=content_density)
+        # Rebuild the content mapper only when the requested density changes
+        if self._content_mapper_density != content_density:
+            self.content_mapper = ContentMapper(content_density=content_density)
+            self._content_mapper_density = content_density
         
-        # Parse the text content
-        if format_type is None:
-            # Auto-detect format
-            parsed_content = self.text_parser.parse_auto(text)
-        elif format_type.lower() == 'markdown':
-            parsed_content = self.text_parser.parse_markdown(text)
-        else:
-            parsed_content = self.text_parser.parse(text)
+        # Parse the text content (None auto-detects, unknown formats parse as plain text)
+        parser_name = self.TEXT_PARSERS.get(
+            format_type.lower() if format_type is not None else None, "parse"
+        )
+        parsed_content = getattr(self.text_parser, parser_name)(text)
             
         # Create metadata for the presentation
         metadata = {
@@ -253,17 +316,23 @@ class PresentationBuilder:
             
         Raises:
             FileNotFoundError: If the file does not exist
-            ValueError: If the file is empty or cannot be parsed
+            ValueError: If the file is empty, larger than MAX_TEXT_FILE_SIZE, or cannot be parsed
         """
         try:
-            # Check if file exists
             file_path_obj = Path(file_path)
-            if not file_path_obj.exists():
-                raise FileNotFoundError(f"File not found: {file_path}")
+            try:
+                file_size = file_path_obj.stat().st_size
+            except FileNotFoundError:
+                raise FileNotFoundError(f"File not found: {file_path}") from None
+                
+            # The whole text is parsed in memory, so refuse inputs that would
+            # exhaust it rather than failing somewhere inside the parser
+            if file_size > MAX_TEXT_FILE_SIZE:
+                raise ValueError(f"File is too large ({file_size} bytes, limit "
+                                 f"{MAX_TEXT_FILE_SIZE}): {file_path}")
             
             # Read the file content
-            with open(file_path, 'r', encoding='utf-8') as f:
-                text = f.read()
+            text = file_path_obj.read_text(encoding='utf-8')
                 
             # If text is empty, raise error
             if not text.strip():
@@ -275,11 +344,7 @@ class PresentationBuilder:
                 
             # Detect format type based on file extension if not provided
             if format_type is None:
-                extension = file_path_obj.suffix.lower()
-                if extension in ['.md', '.markdown']:
-                    format_type = 'markdown'
-                else:
-                    format_type = 'text'
+                format_type = self.EXTENSION_FORMATS.get(file_path_obj.suffix.lower(), 'text')
                     
             # Build presentation from the text content
             return await self.build_presentation_from_text(
@@ -299,21 +364,33 @@ class PresentationBuilder:
     def get_template_info(self) -> Dict[str, Any]:
         """Get information about the current template and theme.
         
+        The result is cached until the slide generator, its template or its
+        theme changes, so treat the returned dictionary as read-only.
+        
         Returns:
             Dictionary containing template and theme information
         """
+        slide_generator = self.slide_generator
+        theme_manager = slide_generator.theme_manager
+        theme = theme_manager.theme
+        cache_key = (id(slide_generator), id(slide_generator.prs), id(theme), theme_manager.version)
+        cached = self._template_info_cache
+        if cached is not None and cached[0] == cache_key:
+            return cached[1]
+            
         theme_info = {
-            "colors": list(self.slide_generator.theme_manager.theme["colors"].keys()),
-            "font_styles": list(self.slide_generator.theme_manager.theme["fonts"].keys()),
-            "spacing": self.slide_generator.theme_manager.theme["spacing"],
-            "alignments": {k: str(v) for k, v in self.slide_generator.theme_manager.theme["alignment"].items()}
+            "colors": list(theme["colors"].keys()),
+            "font_styles": list(theme["fonts"].keys()),
+            "spacing": theme["spacing"],
+            "alignments": {k: str(v) for k, v in theme["alignment"].items()}
         }
         
-        return {
-            "slide_layouts": len(self.slide_generator.prs.slide_layouts),
-            "slide_masters": len(self.slide_generator.prs.slide_masters),
-            "available_layouts": [
-                layout.name for layout in self.slide_generator.prs.slide_layouts
-            ],
+        slide_layouts = slide_generator.prs.slide_layouts
+        template_info = {
+            "slide_layouts": len(slide_layouts),
+            "slide_masters": len(slide_generator.prs.slide_masters),
+            "available_layouts": [layout.name for layout in slide_layouts],
             "theme": theme_info
-        } 
\ No newline at end of file
+        }
+        self._template_info_cache = (cache_key, template_info)
+        return template_info 
\ No newline at end of file
@@ -5,6 +5,8 @@ This module implements the specific pipeline stages for presentation generation,
 building upon the core pipeline architecture.
 """
 
+import asyncio
+from dataclasses import dataclass, fields
 from typing import Dict, Any, List
 import logging
 from pathlib import Path
@@ -21,6 +23,38 @@ from ..presentation.presentation_exporter import PresentationExporter
 
 logger = logging.getLogger(__name__)
 
+@dataclass(frozen=True, slots=True)
+class AssemblyConfig:
+    """Assembly settings resolved from the pipeline context once per run."""
+    output_format: str = "pptx"
+    title: str = "Untitled Presentation"
+    author: str = "Unknown"
+    company: str = ""
+    keywords: str = ""
+    comments: str = ""
+    footer: str = ""
+    
+    @classmethod
+    def from_context(cls, context: PipelineContext) -> "AssemblyConfig":
+        """Read the assembly settings from the context, falling back to the defaults."""
+        data = context._data
+        return cls(**{
+            setting.name: data.get(setting.name, setting.default)
+            for setting in fields(cls)
+        })
+    
+    @property
+    def metadata(self) -> Dict[str, str]:
+        """Document metadata passed to the finalizer."""
+        return {
+            "title": self.title,
+            "author": self.author,
+            "company": self.company,
+            "keywords": self.keywords,
+            "comments": self.comments,
+            "footer": self.footer
+        }
+
 class InputValidationStage(PipelineStage[Dict[str, Any], Dict[str, Any]]):
     """Validates and processes the initial user input."""
     
@@ -86,26 +120,27 @@ class SlideCreationStage(PipelineStage[List[Dict[str, Any]], List[Dict[str, Any]
         super().__init__("Slide Creation")
         self.slide_generator = slide_generator
         self.theme_manager = theme_manager
+        # python-pptx isn't thread-safe, so only one slide is built at a time
+        self._build_lock = asyncio.Lock()
+        
+    async def _create_slide(self, slide_content: Dict[str, Any]) -> Any:
+        """Build one slide in a worker thread so the event loop keeps serving API calls."""
+        async with self._build_lock:
+            return await asyncio.to_thread(self.slide_generator.create_slide_sync, slide_content)
         
     async def process(self, data: List[Dict[str, Any]], context: PipelineContext) -> StageResult[List[Dict[str, Any]]]:
         try:
-            # Apply theme and create slides
-            theme = await self.theme_manager.get_theme(context.get_data("theme_name", "default"))
+            # Slides are built one after another; python-pptx can't build them in parallel
             slides = []
-            
             for slide_content in data:
-                slide = await self.slide_generator.create_slide(
-                    content=slide_content,
-                    theme=theme
-                )
-                slides.append(slide)
+                slides.append(await self._create_slide(slide_content))
                 
             context.set_data("slide_creation_time", context.get_data("current_time"))
             
             return StageResult(
                 status=PipelineStageStatus.COMPLETED,
                 data=slides,
-                metadata={"theme_used": theme.name}
+                metadata={"num_slides": len(slides)}
             )
         except Exception as e:
             logger.error(f"Slide creation failed: {e}")
@@ -123,6 +158,8 @@ class PresentationAssemblyStage(PipelineStage[List[Dict[str, Any]], Path]):
         self.presentation_builder = presentation_builder
         
     async def process(self, data: List[Dict[str, Any]], context: PipelineContext) -> StageResult[Path]:
+        # Resolve the context-derived settings once up front
+        config = AssemblyConfig.from_context(context)
         try:
             # Build presentation
             presentation = await self.presentation_builder.build_presentation(data)
@@ -131,21 +168,11 @@ class PresentationAssemblyStage(PipelineStage[List[Dict[str, Any]], Path]):
             presentation_finalizer = PresentationFinalizer(presentation)
             
             # Finalize presentation (add transitions, animations, etc.)
-            metadata = {
-                "title": context.get_data("title", "Untitled Presentation"),
-                "author": context.get_data("author", "Unknown"),
-                "company": context.get_data("company", ""),
-                "keywords": context.get_data("keywords", ""),
-                "comments": context.get_data("comments", ""),
-                "footer": context.get_data("footer", "")
-            }
-            presentation_finalizer.finalize(metadata)
+            presentation_finalizer.finalize(config.metadata)
             
             # Create exporter and export to file
             presentation_exporter = PresentationExporter(presentation)
-            output_path = await presentation_exporter.export(
-                format=context.get_data("output_format", "pptx")
-            )
+            output_path = await presentation_exporter.export(format=config.output_format)
             
             context.set_data("assembly_time", context.get_data("current_time"))
             
@@ -153,8 +180,8 @@ class PresentationAssemblyStage(PipelineStage[List[Dict[str, Any]], Path]):
                 status=PipelineStageStatus.COMPLETED,
                 data=output_path,
                 metadata={
-                    "output_format": context.get_data("output_format", "pptx"),
-                    "file_size": output_path.stat().st_size
+                    "output_format": config.output_format,
+                    "file_size": presentation_exporter.last_export_size
                 }
             )
         except Exception as e:
@@ -1,19 +1,61 @@
 """
 Prompt templates for slide content generation using OpenAI Assistants API.
 """
-from typing import Dict, List, Optional
+import string
+from textwrap import dedent
+from typing import Any, Dict, List, Optional, Tuple
+import orjson
+
+# Shared parser for template placeholders
+_FORMATTER = string.Formatter()
+
+def _format_value(value: Any) -> str:
+    """Render a template variable.
+    
+    Lists and dicts become compact JSON with sorted keys instead of their
+    Python repr, so equal data always produces the same prompt text.
+    """
+    if isinstance(value, (dict, list, tuple)):
+        try:
+            return orjson.dumps(value, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS).decode("utf-8")
+        except TypeError:
+            pass
+    return str(value)
 
 class PromptTemplate:
     """Base class for prompt templates"""
-    def __init__(self, template: str):
+    def __init__(self, template: str, guidelines: str = ""):
+        """Initialize the template.
+        
+        Args:
+            template: Format string holding the per-slide variables
+            guidelines: Constant instructions that don't depend on the variables
+        """
         self.template = template
+        self.guidelines = guidelines
+        # Parse the placeholders once instead of on every format call. Templates
+        # using conversions, format specs or attribute access keep str.format.
+        parsed = list(_FORMATTER.parse(template))
+        simple = all(
+            field is None or (field.isidentifier() and not spec and not conversion)
+            for _, field, spec, conversion in parsed
+        )
+        self._parsed: Optional[Tuple[Tuple[str, Optional[str]], ...]] = (
+            tuple((literal, field) for literal, field, _, _ in parsed) if simple else None
+        )
+        self._required_fields = frozenset(field for _, field, _, _ in parsed if field)
         
     def format(self, **kwargs) -> str:
         """Format the template with provided variables"""
-        try:
+        missing = self._required_fields.difference(kwargs)
+        if missing:
+            raise ValueError(f"Missing required variable in prompt template: {min(missing)!r}")
+        if self._parsed is None:
             return self.template.format(**kwargs)
-        except KeyError as e:
-            raise ValueError(f"Missing required variable in prompt template: {e}")
+        return "".join([
+            literal + _format_value(kwargs[field]) if field is not None else literal
+            for literal, field in self._parsed
+        ])
 
 class SlidePrompts:
     """Collection of prompt templates for slide generation"""
@@ -24,7 +66,7 @@ class SlidePrompts:
     Subtitle: {subtitle}
     Presenter: {presenter}
     Date: {date}
-    
+    """, guidelines="""
     Format the content professionally and ensure it follows presentation best practices.
     """)
     
@@ -35,7 +77,7 @@ class SlidePrompts:
     {key_points}
     
     Additional Context: {context}
-    
+    """, guidelines="""
     Format the content to be clear, concise, and visually appealing. Use bullet points where appropriate.
     Ensure the content follows the presentation's style guide and maintains consistency.
     """)
@@ -45,7 +87,7 @@ class SlidePrompts:
     Title: {title}
     Data: {data}
     Chart Type: {chart_type}
-    
+    """, guidelines="""
     Additional Requirements:
     - Include clear axis labels and legend
     - Use appropriate color scheme
@@ -57,7 +99,7 @@ class SlidePrompts:
     Create a transition slide for the following section:
     Current Section: {current_section}
     Next Section: {next_section}
-    
+    """, guidelines="""
     Create a smooth transition that maintains the presentation flow and prepares the audience
     for the upcoming content. Include a brief overview of what's coming next.
     """)
@@ -66,26 +108,38 @@ class SlidePrompts:
     Create a summary slide for the following content:
     Main Topics: {main_topics}
     Key Takeaways: {key_takeaways}
-    
+    """, guidelines="""
     Format the summary to be concise yet comprehensive. Highlight the most important points
     and ensure they align with the presentation's objectives.
     """)
 
+    TEMPLATES = {
+        'title': TITLE_SLIDE,
+        'content': CONTENT_SLIDE,
+        'data_viz': DATA_VISUALIZATION_SLIDE,
+        'transition': SECTION_TRANSITION,
+        'summary': SUMMARY_SLIDE
+    }
+
     @staticmethod
     def get_template(template_type: str) -> PromptTemplate:
         """Get a specific prompt template by type"""
-        templates = {
-            'title': SlidePrompts.TITLE_SLIDE,
-            'content': SlidePrompts.CONTENT_SLIDE,
-            'data_viz': SlidePrompts.DATA_VISUALIZATION_SLIDE,
-            'transition': SlidePrompts.SECTION_TRANSITION,
-            'summary': SlidePrompts.SUMMARY_SLIDE
-        }
-        
-        if template_type not in templates:
-            raise ValueError(f"Unknown template type: {template_type}")
+        try:
+            return SlidePrompts.TEMPLATES[template_type]
+        except KeyError:
+            raise ValueError(f"Unknown template type: {template_type}") from None
+
+    @staticmethod
+    def get_guidelines() -> str:
+        """Get the constant guidelines of every template as one block.
         
-        return templates[template_type]
+        The block is identical for every slide, so it belongs in the system
+        message where providers can reuse it as a cached prompt prefix.
+        """
+        return "\n\n".join(
+            f"Guidelines for {template_type} slides:\n{dedent(template.guidelines).strip()}"
+            for template_type, template in SlidePrompts.TEMPLATES.items()
+        )
 
 def generate_slide_prompt(template_type: str, **kwargs) -> str:
     """
@@ -99,4 +153,20 @@ def generate_slide_prompt(template_type: str, **kwargs) -> str:
         Formatted prompt string
     """
     template = SlidePrompts.get_template(template_type)
-    return template.format(**kwargs) 
\ No newline at end of file
+    return template.format(**kwargs) + template.guidelines
+
+def generate_slide_request(template_type: str, **kwargs) -> str:
+    """
+    Generate only the variable part of a slide prompt.
+    
+    Used together with SlidePrompts.get_guidelines() in the system message, so
+    the invariant text forms a shared prefix and only this tail changes per slide.
+    
+    Args:
+        template_type: Type of slide template to use
+        **kwargs: Variables to format the template with
+        
+    Returns:
+        Formatted request string
+    """
+    return SlidePrompts.get_template(template_type).format(**kwargs)
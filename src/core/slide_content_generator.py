@@ -1,56 +1,71 @@
 """
-Slide content generator using OpenAI Assistants API.
+Slide content generator using OpenAI chat completions.
 """
 import logging
 import asyncio
-from typing import Dict, List, Optional, Any
+from typing import AsyncIterator, Dict, List, Optional, Any
+import orjson
 from .openai_client import OpenAIClient
-from .prompt_templates import generate_slide_prompt
+from .llm_cache import LLMCache, make_cache_key
+from .prompt_templates import SlidePrompts, generate_slide_request
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Model and system instructions used for every slide. The instructions include
+# the guidelines of every template so they form one shared prompt prefix.
+SLIDE_CONTENT_MODEL = "gpt-4-turbo-preview"
+SLIDE_CONTENT_INSTRUCTIONS = """You are a professional presentation content generator.
+Your role is to create clear, concise, and engaging slide content that follows
+best practices for presentations. Focus on:
+
+1. Clear and concise messaging
+2. Proper content hierarchy
+3. Consistent formatting
+4. Engaging and professional tone
+5. Appropriate content density per slide
+
+Generate content that can be directly used in presentation slides.
+
+""" + SlidePrompts.get_guidelines()
+
+# Templates that usually appear once per deck, so there is nothing to batch
+UNBATCHED_TEMPLATES = frozenset({"title", "summary"})
+
 class SlideContentGenerator:
-    """Generates slide content using OpenAI Assistants API"""
+    """Generates slide content using OpenAI chat completions"""
     
-    def __init__(self, openai_client: Optional[OpenAIClient] = None, api_key: Optional[str] = None):
+    def __init__(self, openai_client: Optional[OpenAIClient] = None, api_key: Optional[str] = None,
+                 max_concurrency: int = 10, cache: Optional[LLMCache] = None):
         """Initialize the slide content generator.
         
         Args:
             openai_client: Optional OpenAIClient instance. If not provided, one will be created.
             api_key: Optional OpenAI API key. If not provided and openai_client is None,
                     will use environment variable.
+            max_concurrency: Maximum number of slides generated at the same time
+            cache: Optional response cache consulted for deterministic (temperature 0) calls
         """
         self.client = openai_client or OpenAIClient(api_key=api_key)
-        self.assistant_id = None
-        self.thread_id = None
+        self.model = SLIDE_CONTENT_MODEL
+        self.instructions = SLIDE_CONTENT_INSTRUCTIONS
+        self.temperature = 0
+        self.cache = cache
+        self.max_concurrency = max_concurrency
+        self._semaphore = asyncio.Semaphore(max_concurrency)
         
     async def initialize(self) -> None:
-        """Initialize the assistant and thread for slide generation."""
-        # Create a specialized assistant for slide content generation
-        assistant = await self.client.create_assistant(
-            name="Slide Content Generator",
-            instructions="""You are a professional presentation content generator. 
-            Your role is to create clear, concise, and engaging slide content that follows
-            best practices for presentations. Focus on:
-            
-            1. Clear and concise messaging
-            2. Proper content hierarchy
-            3. Consistent formatting
-            4. Engaging and professional tone
-            5. Appropriate content density per slide
-            
-            Generate content that can be directly used in presentation slides.""",
-            model="gpt-4-turbo-preview"
-        )
+        """Prepare the generator for use.
         
-        # Create a new thread for the conversation
-        thread = await self.client.create_thread()
+        Generation is stateless, so there is nothing to set up; kept so existing
+        callers don't need to change.
+        """
         
-        # Store the IDs
-        self.assistant_id = assistant.id
-        self.thread_id = thread.id
+    def _cache_key(self, prompt: str) -> Optional[str]:
+        """Return the response cache key for one slide's prompt, or None when it can't be cached."""
+        # Only deterministic calls are safe to answer from the cache
+        if self.cache is None or self.temperature != 0:
+            return None
+        return make_cache_key(self.model, self.instructions, prompt)
         
     async def generate_slide_content(self, 
                                    template_type: str, 
@@ -62,95 +77,253 @@ class SlideContentGenerator:
         Args:
             template_type: Type of slide template to use (e.g., 'title', 'content')
             variables: Dictionary of variables to format the template with
-            max_retries: Maximum number of retries for content generation
+            max_retries: Maximum number of retries for transient API errors
             timeout: Maximum time to wait for completion in seconds
             
         Returns:
             Dictionary containing the generated slide content
             
         Raises:
-            RuntimeError: If generator not initialized or run fails
-            TimeoutError: If run completion takes longer than timeout
-            ValueError: If template variables are missing
+            TimeoutError: If the completion takes longer than timeout
+            ValueError: If template variables are missing or the response is malformed
         """
-        if not self.assistant_id or not self.thread_id:
-            raise RuntimeError("SlideContentGenerator not initialized. Call initialize() first.")
-            
-        # Generate the prompt using the template
-        prompt = generate_slide_prompt(template_type, **variables)
+        # The template guidelines already live in the system message, so the
+        # user message only carries the per-slide variables. Keeping the
+        # invariant text first lets providers reuse it as a cached prefix.
+        prompt = generate_slide_request(template_type, **variables)
+        messages = [
+            {"role": "system", "content": self.instructions},
+            {"role": "user", "content": prompt}
+        ]
         
-        # Add the prompt as a message to the thread
-        await self.client.add_message(
-            thread_id=self.thread_id,
-            content=prompt
-        )
+        cache_key = self._cache_key(prompt)
+        if cache_key is not None:
+            cached = await self.cache.get(cache_key)
+            if cached is not None:
+                return {
+                    "content": cached,
+                    "type": template_type,
+                    "variables": variables
+                }
         
-        # Run the assistant
-        run = await self.client.run_assistant(
-            thread_id=self.thread_id,
-            assistant_id=self.assistant_id
-        )
-        
-        # Wait for completion with timeout
-        start_time = asyncio.get_event_loop().time()
-        while True:
-            if asyncio.get_event_loop().time() - start_time > timeout:
-                raise TimeoutError("Assistant run timed out")
-                
-            status = await self.client.get_run_status(
-                thread_id=self.thread_id,
-                run_id=run.id
+        # A single stateless request replaces the assistant message/run/poll cycle
+        try:
+            response = await asyncio.wait_for(
+                self.client.create_chat_completion(
+                    model=self.model,
+                    messages=messages,
+                    max_attempts=max_retries + 1,
+                    temperature=self.temperature
+                ),
+                timeout=timeout
             )
+        except asyncio.TimeoutError:
+            raise TimeoutError("Slide content generation timed out") from None
             
-            if status.status == "completed":
-                break
-            elif status.status == "failed":
-                error = status.get("last_error", {})
-                raise RuntimeError(f"Assistant run failed: {error.get('message', 'Unknown error')}")
-                
-            await asyncio.sleep(1)  # Wait before checking again
-        
-        # Get the assistant's response
-        messages = await self.client.get_messages(thread_id=self.thread_id)
-        latest_message = messages.data[0]  # Get the most recent message
-        
         try:
-            # Extract and return the content
-            return {
-                "content": latest_message.content[0].text.value,
-                "type": template_type,
-                "variables": variables
-            }
+            # Extract the content
+            content = response.choices[0].message.content
         except (AttributeError, IndexError) as e:
-            raise ValueError("Invalid response format from assistant") from e
+            raise ValueError("Invalid response format from model") from e
             
-    async def generate_multiple_slides(self, 
-                                     slide_specs: List[Dict[str, Any]],
-                                     max_retries: int = 3) -> List[Dict[str, Any]]:
-        """Generate content for multiple slides.
+        if cache_key is not None:
+            await self.cache.set(cache_key, content)
+            
+        return {
+            "content": content,
+            "type": template_type,
+            "variables": variables
+        }
+            
+    async def iter_slide_contents(self,
+                                  slide_specs: List[Dict[str, Any]],
+                                  max_retries: int = 3) -> AsyncIterator[Dict[str, Any]]:
+        """Generate content for multiple slides, yielding each one as soon as it is ready.
+        
+        Slides sharing a template type are generated together in one completion,
+        except for UNBATCHED_TEMPLATES; a group whose batch fails falls back to
+        one call per slide. Up to max_concurrency requests run at once. Results
+        are still yielded in spec order, so callers can start building a slide
+        while later ones are being generated.
         
         Args:
             slide_specs: List of dictionaries containing template_type and variables for each slide
-            max_retries: Maximum number of retries for content generation
+            max_retries: Maximum number of retries for transient API errors
             
-        Returns:
-            List of dictionaries containing the generated slide content
+        Yields:
+            Dictionaries containing the generated slide content, in spec order. A slide
+            that fails yields a dictionary with an "error" key instead.
         """
-        results = []
-        for spec in slide_specs:
+        loop = asyncio.get_running_loop()
+        results = [loop.create_future() for _ in slide_specs]
+        groups: Dict[str, List[int]] = {}
+        for index, spec in enumerate(slide_specs):
+            groups.setdefault(spec["template_type"], []).append(index)
+            
+        tasks = [
+            asyncio.create_task(self._generate_group(
+                template_type, [slide_specs[index] for index in indices],
+                [results[index] for index in indices], max_retries
+            ))
+            for template_type, indices in groups.items()
+        ]
+        try:
+            for result in results:
+                yield await result
+        finally:
+            # Don't leave generations running if the caller stops early
+            for task in tasks:
+                task.cancel()
+                
+    async def _generate_group(self,
+                              template_type: str,
+                              specs: List[Dict[str, Any]],
+                              results: List["asyncio.Future[Dict[str, Any]]"],
+                              max_retries: int) -> None:
+        """Generate the slides of one template type, resolving each result future."""
+        if len(specs) > 1 and template_type not in UNBATCHED_TEMPLATES:
+            try:
+                async with self._semaphore:
+                    contents = await self._generate_batch(specs, max_retries=max_retries)
+            except Exception as e:
+                logger.warning("Batched generation of %s slides failed, "
+                               "generating them one by one: %s", template_type, e)
+            else:
+                for result, content in zip(results, contents):
+                    result.set_result(content)
+                return
+                
+        async def generate_one(spec: Dict[str, Any], result: "asyncio.Future[Dict[str, Any]]") -> None:
+            result.set_result(await self._generate_or_error(spec, max_retries))
+            
+        await asyncio.gather(*(generate_one(spec, result) for spec, result in zip(specs, results)))
+        
+    async def _generate_or_error(self, spec: Dict[str, Any], max_retries: int) -> Dict[str, Any]:
+        """Generate one slide under the concurrency limit, returning failures as error entries."""
+        async with self._semaphore:
             try:
-                content = await self.generate_slide_content(
+                return await self.generate_slide_content(
                     template_type=spec["template_type"],
                     variables=spec["variables"],
                     max_retries=max_retries
                 )
-                results.append(content)
             except Exception as e:
-                logger.error(f"Error generating slide content: {e}")
+                logger.error("Error generating slide content: %s", e)
                 # Add error information to results
-                results.append({
+                return {
                     "error": str(e),
                     "type": spec["template_type"],
                     "variables": spec["variables"]
-                })
-        return results 
\ No newline at end of file
+                }
+            
+    async def _generate_batch(self,
+                              slide_specs: List[Dict[str, Any]],
+                              max_retries: int = 3,
+                              timeout: float = 60.0) -> List[Dict[str, Any]]:
+        """Generate content for several slides with a single completion.
+        
+        The system prefix is sent once and each slide only adds its variables.
+        Slides are looked up in and added to the response cache one by one, under
+        the same keys generate_slide_content uses, and only the misses are sent.
+        
+        Args:
+            slide_specs: Slide specifications sharing one template type
+            max_retries: Maximum number of retries for transient API errors
+            timeout: Maximum time to wait for completion in seconds
+            
+        Returns:
+            List of dictionaries containing the generated slide content, in spec order
+            
+        Raises:
+            TimeoutError: If the completion takes longer than timeout
+            ValueError: If the response is not a JSON object with one entry per slide
+        """
+        prompts = [
+            generate_slide_request(spec["template_type"], **spec["variables"])
+            for spec in slide_specs
+        ]
+        keys = [self._cache_key(prompt) for prompt in prompts]
+        contents: List[Optional[str]] = [
+            await self.cache.get(key) if key is not None else None
+            for key in keys
+        ]
+        missing = [index for index, content in enumerate(contents) if content is None]
+        if missing:
+            generated = await self._complete_batch([prompts[index] for index in missing],
+                                                   max_retries, timeout)
+            for index, content in zip(missing, generated):
+                contents[index] = content
+                if keys[index] is not None:
+                    await self.cache.set(keys[index], content)
+                    
+        return [
+            {
+                "content": content,
+                "type": spec["template_type"],
+                "variables": spec["variables"]
+            }
+            for spec, content in zip(slide_specs, contents)
+        ]
+        
+    async def _complete_batch(self, prompts: List[str], max_retries: int,
+                              timeout: float) -> List[str]:
+        """Request the content of several slides, given their prompts, in one JSON-mode completion."""
+        count = len(prompts)
+        requests = "\n".join(
+            f"Slide {number}:{prompt}"
+            for number, prompt in enumerate(prompts, 1)
+        )
+        prompt = (
+            f"Generate {count} slides. Return a JSON object with a \"slides\" key holding an "
+            f"array of exactly {count} strings, the content of each slide in the order "
+            f"requested.\n\n{requests}"
+        )
+        messages = [
+            {"role": "system", "content": self.instructions},
+            {"role": "user", "content": prompt}
+        ]
+        
+        try:
+            response = await asyncio.wait_for(
+                self.client.create_chat_completion(
+                    model=self.model,
+                    messages=messages,
+                    max_attempts=max_retries + 1,
+                    temperature=self.temperature,
+                    response_format={"type": "json_object"}
+                ),
+                timeout=timeout
+            )
+        except asyncio.TimeoutError:
+            raise TimeoutError("Batched slide content generation timed out") from None
+            
+        try:
+            slides = orjson.loads(response.choices[0].message.content)["slides"]
+        except (AttributeError, IndexError, KeyError, TypeError, orjson.JSONDecodeError) as e:
+            raise ValueError("Invalid batched response format from model") from e
+        if not isinstance(slides, list) or len(slides) != count:
+            raise ValueError(f"Expected {count} slides in batched response")
+            
+        return [
+            content if isinstance(content, str) else orjson.dumps(content).decode("utf-8")
+            for content in slides
+        ]
+            
+    async def generate_multiple_slides(self, 
+                                     slide_specs: List[Dict[str, Any]],
+                                     max_retries: int = 3) -> List[Dict[str, Any]]:
+        """Generate content for multiple slides.
+        
+        Batches same-template slides as described in iter_slide_contents.
+        
+        Args:
+            slide_specs: List of dictionaries containing template_type and variables for each slide
+            max_retries: Maximum number of retries for transient API errors
+            
+        Returns:
+            List of dictionaries containing the generated slide content
+        """
+        return [
+            content
+            async for content in self.iter_slide_contents(slide_specs, max_retries=max_retries)
+        ]
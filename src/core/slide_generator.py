@@ -2,20 +2,41 @@
 Slide generation functions using python-pptx.
 """
 import logging
+from copy import deepcopy
 from typing import Dict, List, Optional, Any, Tuple
 from pptx import Presentation
 from pptx.util import Inches, Pt
 from pptx.enum.text import PP_ALIGN
 from pptx.dml.color import RGBColor
+from pptx.text.text import _Paragraph
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.parts.slide import SlidePart
 from .theme_manager import ThemeManager
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Write buffer used when saving the presentation file
+SAVE_BUFFER_SIZE = 1024 * 1024
+
+# Text box geometry as (left, top, width, height), converted to EMU once at import
+PRESENTER_BOX = (Inches(0.5), Inches(5.0), Inches(4.0), Inches(0.5))
+DATE_BOX = (Inches(8.5), Inches(5.0), Inches(2.0), Inches(0.5))
+CONTEXT_BOX = (Inches(0.5), Inches(5.0), Inches(9.0), Inches(0.75))
+
+# Largest slide ID PowerPoint accepts
+MAX_SLIDE_ID = 2147483647
+
 class SlideGenerator:
     """Generates different types of slides using python-pptx"""
     
+    # Map template types to creation methods
+    SLIDE_CREATORS = {
+        "title": "create_title_slide",
+        "content": "create_content_slide",
+        "section_transition": "create_section_transition",
+        "summary": "create_summary_slide",
+    }
+    
     def __init__(self, template_path: Optional[str] = None, custom_theme: Optional[Dict[str, Any]] = None):
         """Initialize the slide generator.
         
@@ -24,28 +45,87 @@ class SlideGenerator:
             custom_theme: Optional custom theme settings
         """
         self.prs = Presentation(template_path) if template_path else Presentation()
+        # Next slide ID and the slide count it was read at (see _add_slide)
+        self._next_slide_id = 0
+        self._slide_count = -1
         self.theme_manager = ThemeManager(custom_theme)
         
-    def _add_text_box(self, slide, left: float, top: float, width: float, height: float,
+    def _add_slide(self, slide_layout) -> Any:
+        """Add a slide based on slide_layout, like prs.slides.add_slide.
+        
+        python-pptx's add_slide does two scans of the whole deck for every new
+        slide. It looks for an existing relationship to the new slide part by
+        regrouping every relationship of the presentation part. It also picks
+        the slide ID by reading every ID in use. Adding N slides therefore costs
+        O(N^2). A new part can't be related yet, so the relationship is added
+        directly. The next slide ID is kept here and is read from the document
+        again only when other code (e.g. the finalizer) added or removed slides.
+        
+        Args:
+            slide_layout: Layout the new slide inherits from
+            
+        Returns:
+            The new slide
+        """
+        prs_part = self.prs.part
+        sld_id_lst = self.prs.slides._sldIdLst
+        count = len(sld_id_lst)
+        if (count != self._slide_count or self._next_slide_id > MAX_SLIDE_ID
+                or (count and int(sld_id_lst[-1].get("id")) >= self._next_slide_id)):
+            self._next_slide_id = sld_id_lst._next_id
+            
+        slide_part = SlidePart.new(prs_part._next_slide_partname, prs_part.package, slide_layout.part)
+        rId = prs_part.rels._add_relationship(RT.SLIDE, slide_part)
+        slide = slide_part.slide
+        slide.shapes.clone_layout_placeholders(slide_layout)
+        sld_id_lst._add_sldId(id=self._next_slide_id, rId=rId)
+        
+        self._next_slide_id += 1
+        self._slide_count = count + 1
+        return slide
+        
+    def _add_text_box(self, slide, box: Tuple[int, int, int, int],
                      text: str, style_type: str = "body") -> None:
         """Add a text box to a slide with themed styling.
         
         Args:
             slide: The slide to add the text box to
-            left: Left position in inches
-            top: Top position in inches
-            width: Width in inches
-            height: Height in inches
+            box: Left, top, width and height as python-pptx lengths
             text: Text content
             style_type: Type of text style to apply (title, subtitle, heading, body, caption)
         """
-        txBox = slide.shapes.add_textbox(
-            Inches(left), Inches(top), Inches(width), Inches(height)
-        )
+        txBox = slide.shapes.add_textbox(*box)
         tf = txBox.text_frame
         tf.text = text
         self.theme_manager.apply_text_style(tf.paragraphs[0], style_type)
         
+    def _add_paragraphs(self, tf, items: List[str], level: int, style_type: str = "body") -> None:
+        """Append one styled paragraph per item to a text frame.
+        
+        Only the first paragraph goes through python-pptx's styling setters;
+        the rest are copies of its XML with their own text, so a long list
+        costs one styled paragraph plus a cheap clone per item.
+        
+        Args:
+            tf: The text frame to add paragraphs to
+            items: Paragraph texts
+            level: Bullet indentation level
+            style_type: Type of text style to apply
+        """
+        if not items:
+            return
+        first = tf.add_paragraph()
+        first.text = items[0]
+        first.level = level
+        self.theme_manager.apply_text_style(first, style_type)
+        
+        template = first._p
+        txBody = template.getparent()
+        for item in items[1:]:
+            p_elm = deepcopy(template)
+            txBody.append(p_elm)
+            _Paragraph(p_elm, tf).text = item
+        
     def create_title_slide(self, content: Dict[str, Any]) -> None:
         """Create a title slide.
         
@@ -53,7 +133,7 @@ class SlideGenerator:
             content: Dictionary containing title, subtitle, presenter, and date
         """
         slide_layout = self.prs.slide_layouts[0]  # Title slide layout
-        slide = self.prs.slides.add_slide(slide_layout)
+        slide = self._add_slide(slide_layout)
         
         # Add title
         title = slide.shapes.title
@@ -66,10 +146,10 @@ class SlideGenerator:
         self.theme_manager.apply_text_style(subtitle.text_frame.paragraphs[0], "subtitle")
         
         # Add presenter and date
-        self._add_text_box(slide, 0.5, 5.0, 4.0, 0.5, 
+        self._add_text_box(slide, PRESENTER_BOX,
                           f"Presenter: {content['presenter']}", 
                           style_type="caption")
-        self._add_text_box(slide, 8.5, 5.0, 2.0, 0.5, 
+        self._add_text_box(slide, DATE_BOX,
                           content['date'], 
                           style_type="caption")
         
@@ -80,7 +160,7 @@ class SlideGenerator:
             content: Dictionary containing title and key points
         """
         slide_layout = self.prs.slide_layouts[1]  # Content slide layout
-        slide = self.prs.slides.add_slide(slide_layout)
+        slide = self._add_slide(slide_layout)
         
         # Add title
         title = slide.shapes.title
@@ -92,15 +172,11 @@ class SlideGenerator:
         tf = body.text_frame
         tf.text = ""  # Clear default text
         
-        for point in content["key_points"]:
-            p = tf.add_paragraph()
-            p.text = point
-            p.level = 0  # Top level bullet
-            self.theme_manager.apply_text_style(p, "body")
+        self._add_paragraphs(tf, content["key_points"], level=0)  # Top level bullets
             
         # Add context if provided
         if "context" in content:
-            self._add_text_box(slide, 0.5, 5.0, 9.0, 0.75,
+            self._add_text_box(slide, CONTEXT_BOX,
                              content["context"],
                              style_type="caption")
             
@@ -111,7 +187,7 @@ class SlideGenerator:
             content: Dictionary containing current and next section info
         """
         slide_layout = self.prs.slide_layouts[2]  # Section header layout
-        slide = self.prs.slides.add_slide(slide_layout)
+        slide = self._add_slide(slide_layout)
         
         # Add current section
         title = slide.shapes.title
@@ -130,7 +206,7 @@ class SlideGenerator:
             content: Dictionary containing main topics and key takeaways
         """
         slide_layout = self.prs.slide_layouts[1]  # Content slide layout
-        slide = self.prs.slides.add_slide(slide_layout)
+        slide = self._add_slide(slide_layout)
         
         # Add title
         title = slide.shapes.title
@@ -147,11 +223,7 @@ class SlideGenerator:
         p.text = "Main Topics:"
         self.theme_manager.apply_text_style(p, "heading")
         
-        for topic in content["main_topics"]:
-            p = tf.add_paragraph()
-            p.text = topic
-            p.level = 1
-            self.theme_manager.apply_text_style(p, "body")
+        self._add_paragraphs(tf, content["main_topics"], level=1)
             
         # Add space between sections
         p = tf.add_paragraph()
@@ -162,11 +234,28 @@ class SlideGenerator:
         p.text = "Key Takeaways:"
         self.theme_manager.apply_text_style(p, "heading")
         
-        for takeaway in content["key_takeaways"]:
-            p = tf.add_paragraph()
-            p.text = takeaway
-            p.level = 1
-            self.theme_manager.apply_text_style(p, "body")
+        self._add_paragraphs(tf, content["key_takeaways"], level=1)
+            
+    def create_slide_sync(self, content: Dict[str, Any]) -> Any:
+        """Create the slide for one generated content entry.
+        
+        This is blocking python-pptx work on the shared presentation; async
+        callers should run it with asyncio.to_thread, one call at a time.
+        
+        Args:
+            content: Content entry with the template "type" and its "content"
+            
+        Returns:
+            The slide that was added
+            
+        Raises:
+            ValueError: If the template type has no creation method
+        """
+        creator_name = self.SLIDE_CREATORS.get(content["type"])
+        if creator_name is None:
+            raise ValueError(f"Unknown template type: {content['type']}")
+        getattr(self, creator_name)(content["content"])
+        return self.prs.slides[-1]
             
     def save(self, output_path: str) -> None:
         """Save the presentation.
@@ -174,4 +263,6 @@ class SlideGenerator:
         Args:
             output_path: Path where to save the presentation
         """
-        self.prs.save(output_path) 
\ No newline at end of file
+        # zipfile issues many small writes; a large buffer turns them into few syscalls
+        with open(output_path, "wb", buffering=SAVE_BUFFER_SIZE) as f:
+            self.prs.save(f) 
\ No newline at end of file
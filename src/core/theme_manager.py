@@ -2,15 +2,29 @@
 Theme management for presentations.
 """
 import logging
-from typing import Dict, Any, Optional
+from copy import deepcopy
+from typing import Dict, Any, Optional, Tuple
 from pptx.util import Pt, Inches
 from pptx.dml.color import RGBColor
 from pptx.enum.text import PP_ALIGN
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import nsdecls
+from pptx.text.text import _Paragraph
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Fallback margin, converted to EMU once instead of on every lookup
+DEFAULT_MARGIN = Inches(0.5)
+
+def _copy_dicts(value: Any) -> Any:
+    """Copy nested dicts, sharing their immutable leaf values.
+    
+    copy.deepcopy can't be used here because RGBColor can't be rebuilt by copy.
+    """
+    if isinstance(value, dict):
+        return {key: _copy_dicts(item) for key, item in value.items()}
+    return value
+
 class ThemeManager:
     """Manages presentation themes and styling"""
     
@@ -80,9 +94,14 @@ class ThemeManager:
         Args:
             custom_theme: Optional custom theme to override default settings
         """
-        self.theme = self.DEFAULT_THEME.copy()
+        # Copy nested dicts so merging a custom theme never mutates the shared default
+        self.theme = _copy_dicts(self.DEFAULT_THEME)
+        # Bumped whenever the theme changes so callers can cache derived data
+        self.version = 0
         if custom_theme:
             self._merge_theme(custom_theme)
+        else:
+            self._build_style_cache()
             
     def _merge_theme(self, custom_theme: Dict[str, Any]) -> None:
         """Merge custom theme settings with default theme.
@@ -96,6 +115,29 @@ class ThemeManager:
                     self.theme[category].update(settings)
                 else:
                     self.theme[category] = settings
+        self.version += 1
+        self._build_style_cache()
+        
+    def _build_style_cache(self) -> None:
+        """Resolve each text style's settings into a tuple and a <a:pPr> template."""
+        alignment = self.theme["alignment"]
+        self._text_styles = {
+            style_type: (
+                settings["name"],
+                settings["size"],
+                settings["bold"],
+                settings["color"],
+                alignment.get(style_type, PP_ALIGN.LEFT)
+            )
+            for style_type, settings in self.theme["fonts"].items()
+        }
+        # Style an empty paragraph once per style and keep its <a:pPr>, so
+        # unstyled paragraphs can take a copy instead of running each setter
+        self._pPr_templates = {}
+        for style_type, style in self._text_styles.items():
+            paragraph = _Paragraph(parse_xml(f"<a:p {nsdecls('a')}/>"), None)
+            self._set_text_style(paragraph, style)
+            self._pPr_templates[style_type] = paragraph._p.pPr
                     
     def apply_text_style(self, paragraph, style_type: str) -> None:
         """Apply text styling to a paragraph.
@@ -104,19 +146,39 @@ class ThemeManager:
             paragraph: The paragraph to style
             style_type: Type of style to apply (title, subtitle, heading, body, caption)
         """
-        if style_type not in self.theme["fonts"]:
+        style = self._text_styles.get(style_type)
+        if style is None:
             logger.warning(f"Unknown style type: {style_type}")
             return
             
-        font_settings = self.theme["fonts"][style_type]
+        pPr = paragraph._p.get_or_add_pPr()
+        if len(pPr):
+            # Existing paragraph properties have to be merged setter by setter
+            self._set_text_style(paragraph, style)
+            return
+            
+        styled_pPr = deepcopy(self._pPr_templates[style_type])
+        for attr, value in pPr.attrib.items():
+            if attr != "algn":
+                styled_pPr.set(attr, value)
+        paragraph._p.replace(pPr, styled_pPr)
+        
+    def _set_text_style(self, paragraph, style: Tuple) -> None:
+        """Apply a resolved text style through the python-pptx setters.
+        
+        Args:
+            paragraph: The paragraph to style
+            style: Resolved (name, size, bold, color, alignment) tuple
+        """
+        name, size, bold, color, alignment = style
         font = paragraph.font
         
-        font.name = font_settings["name"]
-        font.size = font_settings["size"]
-        font.bold = font_settings["bold"]
-        font.color.rgb = font_settings["color"]
+        font.name = name
+        font.size = size
+        font.bold = bold
+        font.color.rgb = color
         
-        paragraph.alignment = self.theme["alignment"].get(style_type, PP_ALIGN.LEFT)
+        paragraph.alignment = alignment
         paragraph.space_after = self.theme["spacing"]["paragraph"]
         paragraph.line_spacing = self.theme["spacing"]["line"]
         
@@ -140,4 +202,4 @@ class ThemeManager:
         Returns:
             Margin value in inches
         """
-        return self.theme["spacing"]["margins"].get(side, Inches(0.5)) 
\ No newline at end of file
+        return self.theme["spacing"]["margins"].get(side, DEFAULT_MARGIN) 
\ No newline at end of file
@@ -1,22 +1,44 @@
 """
 Data cleaning and transformation utilities for presentation data.
 """
+import heapq
 import re
-from typing import Any, Dict, List, Union
-import pandas as pd
-import numpy as np
-from nltk.tokenize import sent_tokenize
-from nltk.corpus import stopwords
-import nltk
+import textwrap
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Dict, List, Union
 
-try:
-    nltk.data.find('tokenizers/punkt')
-except LookupError:
-    nltk.download('punkt')
-try:
-    nltk.data.find('corpora/stopwords')
-except LookupError:
-    nltk.download('stopwords')
+# pandas and nltk are slow to import, so they are only loaded by the
+# functions that need them
+if TYPE_CHECKING:
+    import pandas as pd
+
+_WHITESPACE_RE = re.compile(r'\s+')
+_PARENTHESES_RE = re.compile(r'\([^)]*\)')
+_SPECIAL_CHARS_RE = re.compile(r'[^\w\s!?.,—]')
+
+_IMPORTANCE_INDICATORS = frozenset({'key', 'main', 'important', 'significant', 'crucial', 'essential'})
+
+@lru_cache(maxsize=None)
+def _ensure_nltk_data() -> None:
+    """Download the NLTK tokenizer and stopwords data on first use if missing."""
+    import nltk
+    
+    try:
+        nltk.data.find('tokenizers/punkt')
+    except LookupError:
+        nltk.download('punkt')
+    try:
+        nltk.data.find('corpora/stopwords')
+    except LookupError:
+        nltk.download('stopwords')
+
+@lru_cache(maxsize=None)
+def _english_stop_words() -> frozenset:
+    """Load the NLTK English stopwords once and reuse them across calls."""
+    from nltk.corpus import stopwords
+    
+    _ensure_nltk_data()
+    return frozenset(stopwords.words('english'))
 
 def clean_text(text: str) -> str:
     """
@@ -29,19 +51,14 @@ def clean_text(text: str) -> str:
         str: Cleaned text
     """
     # Replace multiple spaces with single space
-    text = re.sub(r'\s+', ' ', text)
+    text = _WHITESPACE_RE.sub(' ', text)
     
     # Remove parentheses and their contents
-    text = re.sub(r'\([^)]*\)', '', text)
+    text = _PARENTHESES_RE.sub('', text)
     
-    # Remove special characters but keep basic punctuation
-    text = re.sub(r'[^\w\s!?.,—]', '', text)
-    
-    # Normalize quotes and apostrophes
-    text = text.replace('"', '').replace('"', '').replace(''', "'").replace(''', "'")
-    
-    # Normalize dashes
-    text = text.replace('--', '—')
+    # Remove special characters but keep basic punctuation; this also strips
+    # quotes, apostrophes and hyphens, so no further normalization is needed
+    text = _SPECIAL_CHARS_RE.sub('', text)
     
     return text.strip()
 
@@ -58,13 +75,15 @@ def clean_list(items: List[str]) -> List[str]:
     cleaned = [clean_text(item) for item in items]
     return [item for item in cleaned if item]
 
-def format_bullet_points(points: List[str], max_length: int = 60) -> List[str]:
+def format_bullet_points(points: List[str], max_length: int = 60, already_cleaned: bool = False) -> List[str]:
     """
     Format text as bullet points, splitting long points into multiple lines.
     
     Args:
         points (List[str]): List of text points to format
         max_length (int): Maximum length for each line
+        already_cleaned (bool): Skip clean_text for points that have already been
+            cleaned, such as the output of extract_key_points
         
     Returns:
         List[str]: Formatted bullet points
@@ -72,31 +91,18 @@ def format_bullet_points(points: List[str], max_length: int = 60) -> List[str]:
     formatted_points = []
     
     for point in points:
-        point = clean_text(point)
+        if not already_cleaned:
+            point = clean_text(point)
         
-        if len(point) <= max_length:
-            formatted_points.append(point)
-        else:
-            # Split long points into multiple lines
-            words = point.split()
-            current_line = []
-            current_length = 0
-            
-            for word in words:
-                if current_length + len(word) + 1 <= max_length:
-                    current_line.append(word)
-                    current_length += len(word) + 1
-                else:
-                    formatted_points.append(' '.join(current_line))
-                    current_line = [word]
-                    current_length = len(word)
-            
-            if current_line:
-                formatted_points.append(' '.join(current_line))
+        # Split long points into multiple lines on word boundaries
+        formatted_points.extend(
+            textwrap.wrap(point, width=max_length, break_long_words=False, break_on_hyphens=False)
+            or ['']
+        )
     
     return formatted_points
 
-def clean_numerical_data(data: Union[pd.DataFrame, Dict[str, List[float]]]) -> Dict[str, Any]:
+def clean_numerical_data(data: Union["pd.DataFrame", Dict[str, List[float]]]) -> Dict[str, Any]:
     """
     Clean and format numerical data for presentation.
     
@@ -106,6 +112,8 @@ def clean_numerical_data(data: Union[pd.DataFrame, Dict[str, List[float]]]) -> D
     Returns:
         Dict containing cleaned data and metadata
     """
+    import pandas as pd
+    
     if isinstance(data, dict):
         df = pd.DataFrame(data)
     else:
@@ -123,12 +131,8 @@ def clean_numerical_data(data: Union[pd.DataFrame, Dict[str, List[float]]]) -> D
     metadata = {
         'row_count': len(df),
         'column_count': len(df.columns),
-        'summary_stats': {
-            'mean': df.mean().to_dict(),
-            'std': df.std().to_dict(),
-            'min': df.min().to_dict(),
-            'max': df.max().to_dict()
-        }
+        # Compute all statistics in one aggregation, keyed by statistic name
+        'summary_stats': df.agg(['mean', 'std', 'min', 'max']).to_dict('index')
     }
     
     return {
@@ -147,11 +151,14 @@ def extract_key_points(text: str, max_points: int = 5) -> List[str]:
     Returns:
         List[str]: Extracted key points
     """
+    from nltk.tokenize import sent_tokenize
+    
     # Split text into sentences
+    _ensure_nltk_data()
     sentences = sent_tokenize(text)
     
     # Score sentences based on importance indicators
-    stop_words = set(stopwords.words('english'))
+    stop_words = _english_stop_words()
     scores = []
     
     for sentence in sentences:
@@ -159,19 +166,18 @@ def extract_key_points(text: str, max_points: int = 5) -> List[str]:
         words = sentence.lower().split()
         
         # Score based on presence of important words/phrases
-        importance_indicators = ['key', 'main', 'important', 'significant', 'crucial', 'essential']
-        score += sum(2 for word in words if word in importance_indicators)
+        score += 2 * sum(map(_IMPORTANCE_INDICATORS.__contains__, words))
         
         # Score based on sentence length (prefer medium-length sentences)
-        word_count = len([w for w in words if w not in stop_words])
+        word_count = len(words) - sum(map(stop_words.__contains__, words))
         if 5 <= word_count <= 20:
             score += 1
         
         scores.append((score, sentence))
     
     # Sort by score and take top N points
-    scores.sort(reverse=True)
-    key_points = [clean_text(sentence) for _, sentence in scores[:max_points]]
+    top_scores = heapq.nlargest(max_points, scores)
+    key_points = [clean_text(sentence) for _, sentence in top_scores]
     
     return key_points
 
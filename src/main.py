@@ -18,6 +18,8 @@ from datetime import datetime
 
 from .core.pipeline_factory import PipelineFactory
 from .core.pipeline import StageResult, PipelineStageStatus
+from .core.openai_client import OpenAIClient
+from .core.llm_cache import InMemoryLLMCache
 from .core.file_path_manager import FilePathManager
 from .core.presentation_builder import PresentationBuilder
 from dotenv import load_dotenv
@@ -40,15 +42,23 @@ load_dotenv()
 class PresentationGenerator:
     """Main class for orchestrating the presentation generation process."""
     
-    def __init__(self, config_path: Optional[Path] = None):
+    def __init__(self, config_path: Optional[Path] = None, config: Optional[Dict[str, Any]] = None):
         """
         Initialize the presentation generator.
         
         Args:
             config_path: Optional path to a JSON configuration file
+            config: Optional configuration dictionary, used instead of config_path
         """
-        self.config = self._load_config(config_path) if config_path else {}
+        if config is not None:
+            self.config = dict(config)
+        else:
+            self.config = self._load_config(config_path) if config_path else {}
         self.file_path_manager = FilePathManager()
+        # Created on first use and shared by every pipeline this generator builds
+        self._openai_client: Optional[OpenAIClient] = None
+        # Slide content cache shared by every pipeline, so repeated requests reuse responses
+        self._llm_cache = InMemoryLLMCache()
         
     def _load_config(self, config_path: Path) -> Dict[str, Any]:
         """Load configuration from a JSON file."""
@@ -75,7 +85,13 @@ class PresentationGenerator:
         try:
             # Create pipeline factory
             base_dir = Path(self.config.get("base_dir", os.getcwd()))
-            factory = PipelineFactory(base_dir=base_dir)
+            if self._openai_client is None:
+                self._openai_client = OpenAIClient()
+            factory = PipelineFactory(
+                base_dir=base_dir,
+                openai_client=self._openai_client,
+                llm_cache=self._llm_cache
+            )
             
             # Create and configure pipeline
             pipeline = await factory.create_pipeline(self.config)
@@ -112,7 +128,7 @@ class PresentationGenerator:
     
     def _setup_progress_tracking(self, pipeline: Any) -> None:
         """Set up progress tracking for the pipeline."""
-        total_stages = len(pipeline._get_all_stages(pipeline))
+        total_stages = len(pipeline.stages)
         completed_stages = 0
         
         async def progress_observer(stage: Any, result: StageResult, context: Any) -> None:
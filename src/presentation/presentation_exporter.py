@@ -1,6 +1,7 @@
 """
 Module for handling presentation export and file output operations.
 """
+from io import BytesIO
 from pathlib import Path
 from typing import Dict, Any, Optional
 from pptx.presentation import Presentation as PresentationType
@@ -16,6 +17,8 @@ class PresentationExporter:
             presentation: The presentation to export
         """
         self.presentation = presentation
+        # Size in bytes of the last exported file, known without a stat call
+        self.last_export_size: Optional[int] = None
         
     def export(self, output_path: str, options: Optional[Dict[str, Any]] = None) -> str:
         """
@@ -48,16 +51,26 @@ class PresentationExporter:
             path.parent.mkdir(parents=True, exist_ok=True)
             
         # Handle existing file
-        if path.exists():
-            if not overwrite:
-                raise FileExistsError(f"File {path} already exists and overwrite=False")
-            if backup_existing:
-                backup_path = path.with_suffix(f".bak{path.suffix}")
-                path.rename(backup_path)
+        exists = path.exists()
+        if exists and not overwrite:
+            raise FileExistsError(f"File {path} already exists and overwrite=False")
+            
+        # Serialize once in memory, before touching any existing file
+        buffer = BytesIO()
+        try:
+            self.presentation.save(buffer)
+        except Exception as e:
+            raise OSError(f"Failed to save presentation: {e}")
+        data = buffer.getvalue()
+        
+        if exists and backup_existing:
+            backup_path = path.with_suffix(f".bak{path.suffix}")
+            path.rename(backup_path)
                 
         try:
-            # Save the presentation
-            self.presentation.save(str(path))
+            # Write the serialized presentation in a single call
+            path.write_bytes(data)
+            self.last_export_size = len(data)
             return str(path)
         except Exception as e:
             # If backup exists and save failed, restore it
@@ -15,8 +15,6 @@ import yaml
 
 from .style_manager import StyleManager, StyleValidationError
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 class BrandAssetError(Exception):
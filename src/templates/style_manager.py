@@ -14,8 +14,6 @@ from enum import Enum
 from copy import deepcopy
 import yaml
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 class StyleLevel(Enum):
@@ -18,8 +18,6 @@ from copy import deepcopy
 from .style_manager import StyleManager
 from .brand_manager import BrandManager
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 class TemplateType(Enum):
@@ -4,8 +4,6 @@ Content mapper module for transforming parsed text into internal slide represent
 import logging
 from typing import Dict, List, Any, Optional
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 class ContentMapper:
@@ -5,8 +5,6 @@ import re
 import logging
 from typing import Dict, List, Any, Optional, Tuple
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 class TextParser:
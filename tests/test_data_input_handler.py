@@ -5,6 +5,8 @@ import pytest
 import json
 import csv
 from pathlib import Path
+from dataclasses import replace
+from unittest.mock import patch
 from src.core.data_input_handler import (
     DataInputHandler,
     TextInputHandler,
@@ -12,6 +14,7 @@ from src.core.data_input_handler import (
     JSONInputHandler,
     create_input_handler
 )
+from src.core.config import CONFIG
 
 @pytest.fixture
 def temp_text_file(tmp_path):
@@ -103,6 +106,26 @@ def test_csv_handler(temp_csv_file):
     assert result["metadata"]["row_count"] == 3
     assert result["metadata"]["column_count"] == 3
 
+def test_csv_handler_duplicate_headers(tmp_path):
+    """Test that duplicate CSV headers are kept as written."""
+    csv_file = tmp_path / "duplicates.csv"
+    csv_file.write_text("a,a,b\n1,2,3\n")
+    
+    result = CSVInputHandler(csv_file).read()
+    
+    assert result["headers"] == ["a", "a", "b"]
+    assert result["rows"] == [["1", "2", "3"]]
+
+def test_csv_handler_ragged_rows(tmp_path):
+    """Test that long and short CSV rows are neither truncated nor padded."""
+    csv_file = tmp_path / "ragged.csv"
+    csv_file.write_text("a,b,c\n1,2,3,4\n5,6\n")
+    
+    result = CSVInputHandler(csv_file).read()
+    
+    assert result["rows"] == [["1", "2", "3", "4"], ["5", "6"]]
+    assert "dataframe" not in result
+
 def test_json_handler(temp_json_file):
     """Test JSON file handler."""
     handler = JSONInputHandler(temp_json_file)
@@ -115,6 +138,41 @@ def test_json_handler(temp_json_file):
     assert "title" in result["metadata"]["top_level_keys"]
     assert result["metadata"]["array_length"] is None
 
+def test_json_iter_items(tmp_path):
+    """Test iterating over the items of a JSON array."""
+    file_path = tmp_path / "records.json"
+    file_path.write_text(json.dumps([{"id": 1}, {"id": 2}, {"id": 3}]))
+    
+    handler = JSONInputHandler(file_path)
+    assert handler._is_top_level_array()
+    assert list(handler.iter_items()) == [{"id": 1}, {"id": 2}, {"id": 3}]
+
+def test_read_cache(temp_json_file, tmp_path):
+    """Test that parse results are cached on disk as JSON when caching is enabled."""
+    cache_dir = tmp_path / "cache"
+    with patch('src.core.data_input_handler.CONFIG', replace(CONFIG, cache_enabled=True)), \
+         patch('src.core.data_input_handler.INPUT_CACHE_DIR', cache_dir):
+        first = JSONInputHandler(temp_json_file).read()
+        cache_files = list(cache_dir.glob("*.json"))
+        assert len(cache_files) == 1
+        assert cache_dir.stat().st_mode & 0o777 == 0o700
+        assert json.loads(cache_files[0].read_bytes()) == first
+        
+        # A second read of the unchanged file is served from the cache
+        cache_files[0].write_text(json.dumps({**first, "type": "cached"}))
+        assert JSONInputHandler(temp_json_file).read()["type"] == "cached"
+
+def test_read_cache_ignores_shared_directory(temp_json_file, tmp_path):
+    """Test that a cache directory other users can write to is never read or written."""
+    cache_dir = tmp_path / "cache"
+    cache_dir.mkdir(mode=0o777)
+    cache_dir.chmod(0o777)
+    with patch('src.core.data_input_handler.CONFIG', replace(CONFIG, cache_enabled=True)), \
+         patch('src.core.data_input_handler.INPUT_CACHE_DIR', cache_dir):
+        JSONInputHandler(temp_json_file).read()
+        
+    assert list(cache_dir.iterdir()) == []
+
 def test_create_input_handler(temp_text_file, temp_csv_file, temp_json_file):
     """Test input handler factory function."""
     # Test text handler creation
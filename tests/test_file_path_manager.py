@@ -94,6 +94,16 @@ def test_get_unique_filepath_increment_sequence(manager, temp_dir):
     second_path = manager.get_unique_filepath(base_path, 'increment')
     assert second_path.name == 'test_2.pptx'
 
+def test_get_unique_filepath_increment_many_versions(manager, temp_dir):
+    """Test incremental numbering when many versions already exist."""
+    base_path = temp_dir / 'test.pptx'
+    base_path.touch()
+    for i in range(1, 38):
+        (temp_dir / f'test_{i}.pptx').touch()
+    
+    unique_path = manager.get_unique_filepath(base_path, 'increment')
+    assert unique_path.name == 'test_38.pptx'
+
 def test_get_unique_filepath_invalid_strategy(manager, temp_dir):
     """Test error handling for invalid strategy."""
     with pytest.raises(ValueError, match="Strategy must be 'timestamp' or 'increment'"):
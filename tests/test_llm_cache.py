@@ -0,0 +1,53 @@
+"""
+Tests for the deterministic LLM response cache.
+"""
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from src.core.llm_cache import InMemoryLLMCache, make_cache_key
+from src.core.slide_content_generator import SlideContentGenerator
+
+def test_make_cache_key():
+    """Test that keys depend on model, system and prompt"""
+    key = make_cache_key("model", "system", "prompt")
+    assert key == make_cache_key("model", "system", "prompt")
+    assert key != make_cache_key("other", "system", "prompt")
+    assert key != make_cache_key("model", "other", "prompt")
+    assert key != make_cache_key("model", "system", "other")
+
+@pytest.mark.asyncio
+async def test_in_memory_cache_lru_eviction():
+    """Test that the least recently used entry is evicted"""
+    cache = InMemoryLLMCache(max_size=2)
+    await cache.set("a", 1)
+    await cache.set("b", 2)
+    assert await cache.get("a") == 1
+    await cache.set("c", 3)
+
+    assert await cache.get("b") is None
+    assert await cache.get("a") == 1
+    assert await cache.get("c") == 3
+    assert len(cache) == 2
+
+@pytest.mark.asyncio
+async def test_slide_content_generator_uses_cache():
+    """Test that repeated deterministic prompts only hit the API once"""
+    client = MagicMock()
+    client.create_chat_completion = AsyncMock(return_value=MagicMock(
+        choices=[MagicMock(message=MagicMock(content="Generated content"))]
+    ))
+    cache = InMemoryLLMCache()
+    generator = SlideContentGenerator(openai_client=client, cache=cache)
+    variables = {
+        "title": "Test Title",
+        "subtitle": "Test Subtitle",
+        "presenter": "Test User",
+        "date": "2024-03-31"
+    }
+
+    first = await generator.generate_slide_content("title", variables)
+    second = await generator.generate_slide_content("title", variables)
+
+    assert first == second
+    assert second["content"] == "Generated content"
+    client.create_chat_completion.assert_awaited_once()
+    assert cache.hits == 1
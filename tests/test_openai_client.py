@@ -7,7 +7,7 @@ import pytest_asyncio
 from unittest.mock import Mock, patch, AsyncMock, MagicMock
 from src.core.openai_client import AssistantsAPIClient, OpenAIRateLimiter, ResponseCache
 import openai
-import tenacity
+from openai.types.chat import ChatCompletion
 
 @pytest.fixture
 def mock_openai_client():
@@ -18,8 +18,8 @@ def mock_openai_client():
         yield mock_client
 
 @pytest_asyncio.fixture
-async def api_client():
-    """Create an API client with mocked OpenAI client."""
+async def api_client(tmp_path):
+    """Create an API client with mocked OpenAI client and a private response cache."""
     with patch('openai.OpenAI') as mock_openai:
         # Create mock instance
         mock_client = AsyncMock()
@@ -28,6 +28,7 @@ async def api_client():
         # Create and return client
         client = AssistantsAPIClient(api_key="test-key")
         client.client = mock_client
+        client.cache = ResponseCache(cache_dir=str(tmp_path / "cache"))
         yield client
 
 def test_client_initialization():
@@ -71,6 +72,18 @@ def test_response_cache(tmp_path):
     cache.set("test_prompt", test_response)
     cached = cache.get("test_prompt")
     assert cached == test_response
+    
+    # Writes go through a temp file that is renamed into place
+    assert [p.suffix for p in tmp_path.iterdir()] == [".json"]
+
+def test_response_cache_hits_are_independent(tmp_path):
+    """Test that mutating a cache hit doesn't change later hits"""
+    cache = ResponseCache(cache_dir=str(tmp_path))
+    cache.set("test_prompt", {"data": {"choices": ["a"]}})
+    
+    cache.get("test_prompt")["data"]["choices"].append("b")
+    
+    assert cache.get("test_prompt") == {"data": {"choices": ["a"]}}
 
 @pytest.mark.asyncio
 async def test_create_assistant(api_client):
@@ -88,6 +101,76 @@ async def test_create_assistant(api_client):
     assert response == mock_response
     api_client.client.beta.assistants.create.assert_called_once()
 
+@pytest.mark.asyncio
+async def test_create_assistant_not_cached(api_client):
+    """Test that every create_assistant call creates a new assistant"""
+    api_client.client.beta.assistants.create = AsyncMock(return_value=MagicMock())
+    
+    await api_client.create_assistant(name="Test Assistant", instructions="Test instructions")
+    await api_client.create_assistant(name="Test Assistant", instructions="Test instructions")
+    
+    assert api_client.client.beta.assistants.create.call_count == 2
+    assert list(api_client.cache.cache_dir.iterdir()) == []
+
+@pytest.mark.asyncio
+async def test_create_chat_completion_cached(api_client):
+    """Test that a repeated temperature 0 completion is served from the cache"""
+    api_client.client.chat.completions.create = AsyncMock(return_value=ChatCompletion(
+        id="chatcmpl-1", created=1, model="gpt-4", object="chat.completion",
+        choices=[{"index": 0, "finish_reason": "stop",
+                  "message": {"role": "assistant", "content": "Cached"}}]
+    ))
+    api_client.rate_limiter.wait_if_needed = AsyncMock()
+    messages = [{"role": "user", "content": "Test prompt"}]
+    
+    first = await api_client.create_chat_completion(model="gpt-4", messages=messages, temperature=0)
+    second = await api_client.create_chat_completion(model="gpt-4", messages=messages, temperature=0)
+    
+    assert second == first
+    assert isinstance(second, ChatCompletion)
+    api_client.client.chat.completions.create.assert_called_once()
+    api_client.rate_limiter.wait_if_needed.assert_called_once()
+
+@pytest.mark.asyncio
+async def test_create_chat_completion_sampled_not_cached(api_client):
+    """Test that completions sampled above temperature 0 always reach the API"""
+    api_client.client.chat.completions.create = AsyncMock(return_value=MagicMock())
+    messages = [{"role": "user", "content": "Test prompt"}]
+    
+    await api_client.create_chat_completion(model="gpt-4", messages=messages, temperature=0.7)
+    await api_client.create_chat_completion(model="gpt-4", messages=messages, temperature=0.7)
+    
+    assert api_client.client.chat.completions.create.call_count == 2
+
+@pytest.mark.parametrize("response_type", ["os:system", "openai.types.model:BaseModel"])
+def test_deserialize_response_rejects_other_types(response_type):
+    """Test that cache entries naming non-SDK types are not rebuilt"""
+    with pytest.raises(ValueError):
+        AssistantsAPIClient._deserialize_response({"type": response_type, "data": {}})
+
+@pytest.mark.asyncio
+async def test_create_chat_completion(api_client):
+    """Test creating a chat completion"""
+    mock_response = MagicMock()
+    mock_response.usage = MagicMock()
+    mock_response.usage.total_tokens = 120
+    api_client.client.chat.completions.create = AsyncMock(return_value=mock_response)
+    messages = [{"role": "user", "content": "Test prompt"}]
+    
+    response = await api_client.create_chat_completion(
+        model="gpt-4-turbo-preview",
+        messages=messages,
+        temperature=0
+    )
+    
+    assert response == mock_response
+    api_client.client.chat.completions.create.assert_called_once_with(
+        model="gpt-4-turbo-preview",
+        messages=messages,
+        temperature=0
+    )
+    assert api_client.total_tokens_used == 120
+
 @pytest.mark.asyncio
 async def test_create_thread(api_client):
     """Test creating a thread"""
@@ -117,6 +200,19 @@ async def test_add_message(api_client):
     assert response == mock_response
     api_client.client.beta.threads.messages.create.assert_called_once()
 
+@pytest.mark.asyncio
+async def test_add_messages(api_client):
+    """Test adding several messages concurrently keeps results in order"""
+    api_client.client.beta.threads.messages.create = AsyncMock(side_effect=["first", "second", "third"])
+    
+    results = await api_client.add_messages(
+        thread_id="test-thread",
+        contents=["one", "two", "three"]
+    )
+    
+    assert results == ["first", "second", "third"]
+    assert api_client.client.beta.threads.messages.create.call_count == 3
+
 @pytest.mark.asyncio
 async def test_run_assistant(api_client):
     """Test running an assistant"""
@@ -149,6 +245,27 @@ async def test_get_run_status(api_client):
     assert response == mock_response
     api_client.client.beta.threads.runs.retrieve.assert_called_once()
 
+@pytest.mark.asyncio
+async def test_wait_for_run(api_client):
+    """Test waiting for a run polls with backoff until a terminal status"""
+    statuses = [MagicMock(status="queued"), MagicMock(status="in_progress"), MagicMock(status="completed")]
+    api_client.client.beta.threads.runs.retrieve = AsyncMock(side_effect=statuses)
+    
+    with patch('src.core.openai_client.asyncio.sleep', new_callable=AsyncMock) as mock_sleep:
+        run = await api_client.wait_for_run(thread_id="test-thread", run_id="test-run")
+    
+    assert run.status == "completed"
+    assert api_client.client.beta.threads.runs.retrieve.call_count == 3
+    assert [call.args[0] for call in mock_sleep.call_args_list] == [0.05, 0.1]
+
+@pytest.mark.asyncio
+async def test_wait_for_run_timeout(api_client):
+    """Test that waiting for a run that never finishes raises TimeoutError"""
+    api_client.client.beta.threads.runs.retrieve = AsyncMock(return_value=MagicMock(status="in_progress"))
+    
+    with pytest.raises(TimeoutError):
+        await api_client.wait_for_run(thread_id="test-thread", run_id="test-run", timeout=0.2)
+
 @pytest.mark.asyncio
 async def test_get_messages(api_client):
     """Test getting messages from a thread"""
@@ -179,33 +296,59 @@ async def test_token_usage_tracking(api_client):
     assert usage["total_tokens"] == 100
 
 @pytest.mark.asyncio
-async def test_error_handling():
-    """Test error handling for different types of errors"""
-    mock_client = AsyncMock()
-    with patch('openai.OpenAI', return_value=mock_client):
-        client = AssistantsAPIClient(api_key="test-key")
-
-        # Test rate limit error using APIStatusError
-        mock_client.beta.threads.create = AsyncMock(
-            side_effect=openai.APIStatusError(
+async def test_error_handling(api_client):
+    """Test retry handling for different types of errors"""
+    api_client.rate_limiter.wait_if_needed = AsyncMock()
+    
+    with patch('src.core.openai_client.asyncio.sleep', new_callable=AsyncMock) as mock_sleep:
+        # Rate limit errors are retried, honoring the Retry-After header
+        api_client.client.beta.threads.create = AsyncMock(
+            side_effect=openai.RateLimitError(
                 message="Rate limit exceeded",
-                response=Mock(status_code=429),
+                response=Mock(status_code=429, headers={"retry-after": "2"}),
                 body={"error": {"message": "Rate limit exceeded", "type": "rate_limit_error"}}
             )
         )
-
-        # Should trigger retry and eventually raise RetryError
-        with pytest.raises(tenacity.RetryError):
-            await client.create_thread()
-
-        # Test API error using APIConnectionError (simpler constructor)
-        mock_client.beta.threads.create = AsyncMock(
-            side_effect=openai.APIConnectionError(message="Connection error")
+        
+        with pytest.raises(openai.RateLimitError):
+            await api_client.create_thread()
+        assert api_client.client.beta.threads.create.call_count == api_client.max_retries
+        assert [call.args[0] for call in mock_sleep.call_args_list] == [2.0] * (api_client.max_retries - 1)
+        
+        # Connection errors are retried with jittered backoff
+        mock_sleep.reset_mock()
+        api_client.client.beta.threads.create = AsyncMock(
+            side_effect=openai.APIConnectionError(message="Connection error", request=Mock())
         )
+        
+        with pytest.raises(openai.APIConnectionError):
+            await api_client.create_thread()
+        assert api_client.client.beta.threads.create.call_count == api_client.max_retries
+        assert all(0 <= call.args[0] <= 60 for call in mock_sleep.call_args_list)
+        
+        # Other errors are not retried
+        api_client.client.beta.threads.create = AsyncMock(side_effect=ValueError("bad request"))
+        
+        with pytest.raises(ValueError):
+            await api_client.create_thread()
+        api_client.client.beta.threads.create.assert_called_once()
 
-        # Should also trigger retry and eventually raise RetryError
-        with pytest.raises(tenacity.RetryError):
-            await client.create_thread()
-
-        # Verify token usage is properly tracked even with errors
-        assert client.get_token_usage()["total_api_calls"] > 0 
\ No newline at end of file
+@pytest.mark.asyncio
+async def test_create_chat_completion_max_attempts(api_client):
+    """Test that a per-call attempt budget overrides the client's max_retries"""
+    api_client.rate_limiter.wait_if_needed = AsyncMock()
+    api_client.client.chat.completions.create = AsyncMock(
+        side_effect=openai.APIConnectionError(message="Connection error", request=Mock())
+    )
+    
+    with patch('src.core.openai_client.asyncio.sleep', new_callable=AsyncMock):
+        with pytest.raises(openai.APIConnectionError):
+            await api_client.create_chat_completion(
+                model="gpt-4-turbo-preview",
+                messages=[{"role": "user", "content": "Test prompt"}],
+                max_attempts=api_client.max_retries + 2
+            )
+    assert api_client.client.chat.completions.create.call_count == api_client.max_retries + 2
+    
+    # Failed calls are not counted as API calls
+    assert api_client.get_token_usage()["total_api_calls"] == 0
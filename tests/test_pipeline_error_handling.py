@@ -4,6 +4,7 @@ Tests for pipeline error handling functionality.
 
 import pytest
 import asyncio
+import logging
 from pathlib import Path
 import json
 from datetime import datetime
@@ -18,6 +19,8 @@ from src.core.pipeline_error_handlers import (
     ErrorHandler
 )
 from src.core.pipeline_factory import PipelineFactory
+from src.core.llm_cache import InMemoryLLMCache
+from src.core.presentation_pipeline_stages import SlideCreationStage
 
 # Test data
 TEST_DATA = {
@@ -120,6 +123,11 @@ async def test_retry_strategy():
     await strategy.recover(Exception(), context)
     # Should not allow more retries
     assert not await strategy.can_recover(Exception(), context)
+    
+    # A fresh context (new pipeline execution) starts counting again
+    fresh_context = PipelineContext()
+    fresh_context.set_data("current_stage_name", "test_stage")
+    assert await strategy.can_recover(Exception(), fresh_context)
 
 @pytest.mark.asyncio
 async def test_fallback_content_strategy(temp_dirs):
@@ -135,6 +143,10 @@ async def test_fallback_content_strategy(temp_dirs):
     assert result is not None
     assert "slides" in result
     
+    # Each recovery gets its own copy of the template
+    result["slides"].clear()
+    assert (await strategy.recover(ConnectionError(), context))["slides"]
+    
     # Should not recover from other errors
     assert not await strategy.can_recover(ValueError(), context)
 
@@ -161,6 +173,51 @@ async def test_auto_save_strategy(temp_dirs):
     assert checkpoint_data["stage_name"] == "test_stage"
     assert checkpoint_data["input_data"] == TEST_DATA
 
+@pytest.mark.asyncio
+async def test_auto_save_strategy_rotation(temp_dirs):
+    """Test that burst checkpoints get unique names and old ones are rotated out."""
+    strategy = AutoSaveStrategy(temp_dirs["checkpoints"], max_keep=3)
+    context = PipelineContext()
+    
+    for i in range(5):
+        context.set_data("current_stage_name", f"stage_{i}")
+        await strategy.recover(Exception(), context)
+    
+    checkpoints = sorted(temp_dirs["checkpoints"].glob("checkpoint_*.json"))
+    assert len(checkpoints) == 3
+    stage_names = [json.loads(p.read_text())["stage_name"] for p in checkpoints]
+    assert stage_names == ["stage_2", "stage_3", "stage_4"]
+
+@pytest.mark.asyncio
+async def test_auto_save_strategy_large_input(temp_dirs, monkeypatch):
+    """Test that oversized stage input is summarized unless full capture is requested."""
+    monkeypatch.setattr("src.core.pipeline_error_handlers.CHECKPOINT_INPUT_LIMIT", 16)
+    strategy = AutoSaveStrategy(temp_dirs["checkpoints"])
+    context = PipelineContext()
+    context.set_data("current_stage_name", "test_stage")
+    context.set_data("stage_input_data", TEST_DATA)
+    
+    # Recovery still hands back the real input
+    assert await strategy.recover(Exception(), context) == TEST_DATA
+    context.set_data("checkpoint_full", True)
+    await strategy.recover(Exception(), context)
+    
+    summary, full = [
+        json.loads(p.read_text())["input_data"]
+        for p in sorted(temp_dirs["checkpoints"].glob("checkpoint_*.json"))
+    ]
+    assert summary["type"] == "dict"
+    assert summary["size"] > 16
+    assert full == TEST_DATA
+
+def test_auto_save_strategy_capture_input(temp_dirs):
+    """Test that small plain JSON input is kept and anything else is summarized."""
+    strategy = AutoSaveStrategy(temp_dirs["checkpoints"])
+    
+    assert strategy._capture_input(TEST_DATA, full=False) == TEST_DATA
+    assert strategy._capture_input({"created": datetime.now()}, full=False)["size"] is None
+    assert strategy._capture_input(b"\x89PNG", full=False)["size"] == 4
+
 @pytest.mark.asyncio
 async def test_error_handler_recovery():
     """Test that error handler properly coordinates recovery strategies."""
@@ -267,4 +324,107 @@ async def test_pipeline_factory_error_handling(temp_dirs):
     
     # Verify error handlers were added to stages
     for stage in factory._get_all_stages(pipeline):
-        assert len(stage._error_handlers) > 0 
\ No newline at end of file
+        assert len(stage._error_handlers) > 0 
+@pytest.mark.asyncio
+async def test_parallel_error_handlers():
+    """Test that side-effect-free handlers run concurrently and the first recovery wins."""
+    stage = MockFailingStage("test_stage")
+    stage.parallel_error_handlers = True
+    second_started = asyncio.Event()
+    
+    async def failing_handler(error, context):
+        # Only completes if the second handler runs while this one is waiting
+        await asyncio.wait_for(second_started.wait(), timeout=1)
+        raise RuntimeError("handler failed")
+    
+    async def recovering_handler(error, context):
+        second_started.set()
+        return TEST_DATA
+    
+    stage.add_error_handler(failing_handler)
+    stage.add_error_handler(recovering_handler)
+    
+    result = await stage.handle_error(Exception(), PipelineContext())
+    
+    assert result == TEST_DATA
+
+@pytest.mark.asyncio
+async def test_pipeline_factory_error_handlers_bind_stage_name(temp_dirs):
+    """Test that each factory error handler reports its own stage and returns the recovery."""
+    factory = PipelineFactory(base_dir=temp_dirs["base"], input_path=temp_dirs["input_file"])
+    pipeline = await factory.create_pipeline()
+    
+    for stage in factory._get_all_stages(pipeline):
+        stage_handler = factory._error_handlers[stage.name]
+        context = PipelineContext()
+        with patch.object(stage_handler, "handle_error", AsyncMock(return_value=TEST_DATA)):
+            result = await stage._error_handlers[0](Exception(), context)
+        assert result == TEST_DATA
+        assert context.get_data("current_stage_name") == stage.name
+        assert context.get_data("stage_input_data") == TEST_DATA
+
+def test_pipeline_factory_shares_llm_cache(temp_dirs):
+    """Test that the factory hands its LLM cache to the content generator."""
+    cache = InMemoryLLMCache()
+    factory = PipelineFactory(base_dir=temp_dirs["base"], openai_client=Mock(), llm_cache=cache)
+    
+    assert factory.content_generator.cache is cache
+    assert PipelineFactory(base_dir=temp_dirs["base"], openai_client=Mock()).content_generator.cache is not None
+
+@pytest.mark.asyncio
+async def test_pipeline_factory_separate_slide_generators(temp_dirs):
+    """Test that the slide stage and the builder don't build into the same deck."""
+    factory = PipelineFactory(base_dir=temp_dirs["base"], openai_client=Mock())
+    pipeline = await factory.create_pipeline()
+    
+    slide_stage = next(stage for stage in pipeline.stages if isinstance(stage, SlideCreationStage))
+    
+    assert slide_stage.slide_generator is not factory.presentation_builder.slide_generator
+    assert slide_stage.theme_manager is slide_stage.slide_generator.theme_manager
+
+def test_pipeline_stages_follow_executed_chain():
+    """Test that Pipeline.stages lists the stages execute runs and picks up later links."""
+    first = MockFailingStage("first")
+    left = MockFailingStage("left")
+    right = MockFailingStage("right")
+    last = MockFailingStage("last")
+    first.add_next_stage(left)
+    first.add_next_stage(right)
+    right.add_next_stage(last)
+    
+    pipeline = Pipeline(first)
+    
+    assert [stage.name for stage in pipeline.stages] == ["first", "left"]
+    assert pipeline.stages is pipeline.stages
+    
+    left.add_next_stage(last)
+    
+    assert [stage.name for stage in pipeline.stages] == ["first", "left", "last"]
+
+@pytest.mark.asyncio
+async def test_slide_creation_stage_builds_slides_in_order():
+    """Test that SlideCreationStage builds every slide in input order without a theme lookup."""
+    slide_generator = Mock()
+    slide_generator.create_slide_sync.side_effect = lambda content: content["title"]
+    stage = SlideCreationStage(slide_generator, Mock(spec=[]))
+    
+    result = await stage.process([{"title": "A"}, {"title": "B"}], PipelineContext())
+    
+    assert result.status == PipelineStageStatus.COMPLETED
+    assert result.data == ["A", "B"]
+
+@pytest.mark.asyncio
+async def test_pipeline_factory_logs_every_stage_time(temp_dirs, caplog):
+    """Test that the performance observer finds the timing key of every stage."""
+    factory = PipelineFactory(base_dir=temp_dirs["base"], openai_client=Mock())
+    pipeline = await factory.create_pipeline()
+    for key in ("input_validation_time", "content_generation_time",
+                "slide_creation_time", "assembly_time"):
+        pipeline.context.set_data(key, "12:00")
+        
+    with caplog.at_level(logging.INFO, logger="src.core.pipeline_factory"):
+        for stage in pipeline.stages:
+            await pipeline._notify_observers(stage, StageResult(status=PipelineStageStatus.COMPLETED))
+            
+    logged = [record.getMessage() for record in caplog.records if "completed at" in record.getMessage()]
+    assert len(logged) == len(pipeline.stages) == 4
@@ -15,12 +15,21 @@ async def temp_pptx(tmp_path):
     test_dir.mkdir()
     return test_dir / "test.pptx"
 
+def mock_slide_stream(contents=None, error=None):
+    """Create a mock for iter_slide_contents that streams contents or raises error."""
+    async def stream(*args, **kwargs):
+        if error is not None:
+            raise error
+        for content in contents:
+            yield content
+    return MagicMock(side_effect=stream)
+
 @pytest.fixture
 def presentation_builder():
     """Create a mock presentation builder."""
     builder = PresentationBuilder()
     builder.content_generator = MagicMock()
-    builder.content_generator.generate_multiple_slides = AsyncMock()
+    builder.content_generator.iter_slide_contents = mock_slide_stream([])
     builder.slide_generator = MagicMock()
     builder.slide_generator.prs = MagicMock()
     return builder
@@ -49,7 +58,7 @@ async def test_build_presentation(presentation_builder, temp_pptx):
     ]
 
     # Configure mock response for content generation
-    presentation_builder.content_generator.generate_multiple_slides = AsyncMock(return_value=[
+    presentation_builder.content_generator.iter_slide_contents = mock_slide_stream([
         {
             "type": "title",
             "content": {
@@ -90,7 +99,7 @@ async def test_build_presentation(presentation_builder, temp_pptx):
         )
 
     # Verify calls
-    presentation_builder.content_generator.generate_multiple_slides.assert_called_once_with(
+    presentation_builder.content_generator.iter_slide_contents.assert_called_once_with(
         slide_specs,
         max_retries=3
     )
@@ -134,7 +143,7 @@ async def test_build_presentation_from_outline(presentation_builder, temp_pptx):
     ]
 
     # Configure mock response for content generation
-    presentation_builder.content_generator.generate_multiple_slides = AsyncMock(return_value=[
+    presentation_builder.content_generator.iter_slide_contents = mock_slide_stream([
         {
             "type": "title",
             "content": {"title": "Test Title", "subtitle": "Generated", "presenter": "Test", "date": "2024"}
@@ -185,7 +194,7 @@ async def test_build_presentation_from_outline(presentation_builder, temp_pptx):
         )
 
     # Verify calls
-    presentation_builder.content_generator.generate_multiple_slides.assert_called_once()
+    presentation_builder.content_generator.iter_slide_contents.assert_called_once()
     assert presentation_builder.slide_generator.create_title_slide.call_count == 1
     assert presentation_builder.slide_generator.create_section_transition.call_count == 2
     assert presentation_builder.slide_generator.create_content_slide.call_count == 2
@@ -215,8 +224,8 @@ async def test_error_handling(presentation_builder, temp_pptx):
     ]
 
     # Configure mock to return an error
-    presentation_builder.content_generator.generate_multiple_slides = AsyncMock(
-        side_effect=Exception("Content generation failed")
+    presentation_builder.content_generator.iter_slide_contents = mock_slide_stream(
+        error=Exception("Content generation failed")
     )
 
     # Build presentation should handle the error
@@ -241,7 +250,7 @@ async def test_export_error_handling(presentation_builder, temp_pptx):
     ]
 
     # Configure mock to succeed in content generation but fail on export
-    presentation_builder.content_generator.generate_multiple_slides = AsyncMock(return_value=[
+    presentation_builder.content_generator.iter_slide_contents = mock_slide_stream([
         {
             "type": "title",
             "content": slide_specs[0]["variables"]
@@ -284,7 +293,7 @@ async def test_save_error_handling(presentation_builder, temp_pptx):
     ]
 
     # Configure mock to succeed in content generation but fail on save
-    presentation_builder.content_generator.generate_multiple_slides = AsyncMock(return_value=[
+    presentation_builder.content_generator.iter_slide_contents = mock_slide_stream([
         {
             "type": "title",
             "content": slide_specs[0]["variables"]
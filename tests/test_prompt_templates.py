@@ -2,7 +2,7 @@
 Tests for the prompt templates module.
 """
 import pytest
-from src.core.prompt_templates import PromptTemplate, SlidePrompts, generate_slide_prompt
+from src.core.prompt_templates import PromptTemplate, SlidePrompts, generate_slide_prompt, generate_slide_request
 
 def test_prompt_template_format():
     """Test basic prompt template formatting"""
@@ -16,6 +16,21 @@ def test_prompt_template_missing_variable():
     with pytest.raises(ValueError):
         template.format()
 
+def test_prompt_template_matches_str_format():
+    """Test that pre-parsed formatting matches str.format, escapes included"""
+    for template_text in ("{{literal}} {name} and {count}", "Value: {count:>5}"):
+        template = PromptTemplate(template_text)
+        assert template.format(name="World", count=3) == template_text.format(name="World", count=3)
+
+def test_prompt_template_structured_variables():
+    """Test that dicts and lists are rendered as canonical JSON"""
+    template = PromptTemplate("Data: {data}")
+    
+    first = template.format(data={"b": 2, "a": [1, 2]})
+    second = template.format(data={"a": [1, 2], "b": 2})
+    
+    assert first == second == 'Data: {"a":[1,2],"b":2}'
+
 def test_title_slide_template():
     """Test title slide template formatting"""
     variables = {
@@ -89,4 +104,20 @@ def test_summary_slide_template():
 def test_invalid_template_type():
     """Test handling of invalid template type"""
     with pytest.raises(ValueError):
-        generate_slide_prompt('invalid_type', title='Test') 
\ No newline at end of file
+        generate_slide_prompt('invalid_type', title='Test') 
+
+def test_slide_request_excludes_guidelines():
+    """Test that constant guidelines are split from the variable request"""
+    variables = {
+        'current_section': 'Features',
+        'next_section': 'Implementation'
+    }
+    
+    request = generate_slide_request('transition', **variables)
+    guidelines = SlidePrompts.get_guidelines()
+    
+    assert 'Features' in request
+    assert 'smooth transition' not in request
+    assert 'smooth transition' in guidelines
+    assert 'Features' not in guidelines
+    assert generate_slide_prompt('transition', **variables).startswith(request)
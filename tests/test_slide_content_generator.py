@@ -2,76 +2,59 @@
 Tests for slide content generation functionality.
 """
 import os
+import asyncio
 import pytest
 import pytest_asyncio
 from unittest.mock import AsyncMock, patch, MagicMock
 from src.core.slide_content_generator import SlideContentGenerator
+from src.core.llm_cache import InMemoryLLMCache
+
+def completion(content):
+    """Build a minimal chat completion response"""
+    return MagicMock(choices=[MagicMock(message=MagicMock(content=content))])
+
+TITLE_VARIABLES = {
+    "title": "Test Title",
+    "subtitle": "Test Subtitle",
+    "presenter": "Test User",
+    "date": "2024-03-31"
+}
+
+CONTENT_VARIABLES = {
+    "title": "Test Content",
+    "key_points": "- Point 1",
+    "context": "Test context"
+}
 
 @pytest_asyncio.fixture
 async def content_generator():
-    """Create a slide content generator with mocked OpenAI client."""
-    with patch('src.core.slide_content_generator.AssistantsAPIClient') as mock_client:
-        # Create mock instance
-        mock_api = AsyncMock()
-        mock_client.return_value = mock_api
-        
-        # Configure mock responses
-        mock_api.create_assistant.return_value = MagicMock(id="test-assistant")
-        mock_api.create_thread.return_value = MagicMock(id="test-thread")
-        mock_api.add_message.return_value = MagicMock(id="test-message")
-        mock_api.run_assistant.return_value = MagicMock(id="test-run")
-        mock_api.get_run_status.return_value = MagicMock(status="completed")
-        mock_api.get_messages.return_value = MagicMock(
-            data=[
-                MagicMock(
-                    content=[
-                        MagicMock(
-                            text=MagicMock(
-                                value='{"type": "title", "content": {"title": "Test Title", "subtitle": "Test Subtitle"}}'
-                            )
-                        )
-                    ]
-                )
-            ]
-        )
-        
-        generator = SlideContentGenerator(api_key="test-key")
-        generator.api_client = mock_api
-        yield generator
+    """Create a slide content generator with a mocked OpenAI client."""
+    client = MagicMock()
+    client.create_chat_completion = AsyncMock(return_value=completion("Generated content"))
+    yield SlideContentGenerator(openai_client=client)
 
 @pytest.mark.asyncio
 async def test_initialize(content_generator):
-    """Test initialization of the content generator."""
+    """Test that initialization needs no API calls."""
     await content_generator.initialize()
     
-    content_generator.api_client.create_assistant.assert_called_once()
-    content_generator.api_client.create_thread.assert_called_once()
-    assert content_generator.assistant_id == "test-assistant"
-    assert content_generator.thread_id == "test-thread"
+    content_generator.client.create_chat_completion.assert_not_awaited()
 
 @pytest.mark.asyncio
 async def test_generate_slide_content(content_generator):
     """Test generating slide content."""
-    await content_generator.initialize()
-    
-    variables = {
-        "title": "Test Title",
-        "subtitle": "Test Subtitle",
-        "presenter": "Test User",
-        "date": "2024-03-31"
-    }
-    
-    result = await content_generator.generate_slide_content("title", variables)
+    result = await content_generator.generate_slide_content("title", TITLE_VARIABLES)
     
-    assert "content" in result
+    assert result["content"] == "Generated content"
     assert result["type"] == "title"
-    assert result["variables"] == variables
+    assert result["variables"] == TITLE_VARIABLES
+    kwargs = content_generator.client.create_chat_completion.call_args.kwargs
+    assert kwargs["messages"][0]["role"] == "system"
+    assert "Test Title" in kwargs["messages"][-1]["content"]
 
 @pytest.mark.asyncio
 async def test_generate_multiple_slides(content_generator):
     """Test generating multiple slides."""
-    await content_generator.initialize()
-    
     slides = [
         {
             "template_type": "title",
@@ -86,8 +69,7 @@ async def test_generate_multiple_slides(content_generator):
             "template_type": "content",
             "variables": {
                 "title": "Test Content",
-                "subtitle": "Content Details",
-                "key_points": ["Point 1", "Point 2"],
+                "key_points": "- Point 1\n- Point 2",
                 "context": "Test context"
             }
         }
@@ -103,106 +85,155 @@ async def test_generate_multiple_slides(content_generator):
 
 @pytest.mark.asyncio
 async def test_error_handling(content_generator):
-    """Test error handling in content generation."""
-    await content_generator.initialize()
-    
-    # Configure mock to simulate API error
-    content_generator.api_client.add_message.side_effect = Exception("API Error")
+    """Test that API errors propagate from content generation."""
+    content_generator.client.create_chat_completion.side_effect = Exception("API Error")
     
     with pytest.raises(Exception) as exc_info:
-        await content_generator.generate_slide_content(
-            "title",
-            {
-                "title": "Test Title",
-                "subtitle": "Test Subtitle",
-                "presenter": "Test User",
-                "date": "2024-03-31"
-            }
-        )
+        await content_generator.generate_slide_content("title", TITLE_VARIABLES)
     assert str(exc_info.value) == "API Error"
 
 @pytest.mark.asyncio
-async def test_run_completion_timeout(content_generator):
-    """Test handling of run completion timeout."""
-    await content_generator.initialize()
-    
-    # Configure mock to simulate timeout
-    content_generator.api_client.get_run_status.return_value = MagicMock(status="in_progress")
+async def test_generation_timeout(content_generator):
+    """Test that a completion slower than the timeout raises TimeoutError."""
+    async def slow_completion(**kwargs):
+        await asyncio.sleep(1)
+        return completion("Too late")
+    content_generator.client.create_chat_completion.side_effect = slow_completion
     
     with pytest.raises(TimeoutError):
-        await content_generator.generate_slide_content(
-            "title",
-            {
-                "title": "Test Title",
-                "subtitle": "Test Subtitle",
-                "presenter": "Test User",
-                "date": "2024-03-31"
-            },
-            timeout=0.1
-        )
+        await content_generator.generate_slide_content("title", TITLE_VARIABLES, timeout=0.01)
 
 @pytest.mark.asyncio
-async def test_run_completion_error(content_generator):
-    """Test handling of run completion error."""
-    await content_generator.initialize()
+async def test_generate_multiple_slides_reports_errors(content_generator):
+    """Test that a failing slide yields an error entry instead of raising."""
+    content_generator.client.create_chat_completion.side_effect = Exception("API Error")
     
-    # Configure mock to simulate run failure
-    content_generator.api_client.get_run_status.return_value = MagicMock(
-        status="failed",
-        last_error={"code": "error_code", "message": "Run failed"},
-        get=lambda x, y=None: {"code": "error_code", "message": "Run failed"} if x == "last_error" else y
+    results = await content_generator.generate_multiple_slides(
+        [{"template_type": "title", "variables": TITLE_VARIABLES}]
     )
     
-    with pytest.raises(RuntimeError) as exc_info:
-        await content_generator.generate_slide_content(
-            "title",
-            {
-                "title": "Test Title",
-                "subtitle": "Test Subtitle",
-                "presenter": "Test User",
-                "date": "2024-03-31"
-            }
-        )
-    assert "Run failed" in str(exc_info.value)
+    assert results[0]["error"] == "API Error"
+    assert results[0]["type"] == "title"
 
 @pytest.mark.asyncio
 async def test_invalid_response_format(content_generator):
-    """Test handling of invalid response format."""
-    await content_generator.initialize()
+    """Test handling of a response without choices."""
+    content_generator.client.create_chat_completion.return_value = MagicMock(choices=[])
     
-    # Configure mock to return invalid response format
-    content_generator.api_client.get_messages.return_value = MagicMock(
-        data=[
-            MagicMock(
-                content=[
-                    MagicMock(
-                        # Return None for text to trigger AttributeError
-                        text=None
-                    )
-                ]
-            )
-        ]
-    )
+    with pytest.raises(ValueError) as exc_info:
+        await content_generator.generate_slide_content("title", TITLE_VARIABLES)
+    assert "Invalid response format" in str(exc_info.value)
+
+@pytest.mark.asyncio
+async def test_invalid_batch_json(content_generator):
+    """Test that a batched response that isn't JSON raises ValueError."""
+    content_generator.client.create_chat_completion.return_value = completion("not json")
     
     with pytest.raises(ValueError) as exc_info:
-        await content_generator.generate_slide_content(
-            "title",
-            {
-                "title": "Test Title",
-                "subtitle": "Test Subtitle",
-                "presenter": "Test User",
-                "date": "2024-03-31"
-            }
+        await content_generator._generate_batch(
+            [{"template_type": "content", "variables": CONTENT_VARIABLES}] * 2
         )
-    assert "Invalid response format" in str(exc_info.value)
+    assert "Invalid batched response format" in str(exc_info.value)
 
 @pytest.mark.asyncio
-async def test_uninitialized_error():
-    """Test error when using uninitialized generator."""
-    with patch.dict('os.environ', {'OPENAI_API_KEY': 'test-key'}):
-        generator = SlideContentGenerator(api_key="test-key")
-        
-        with pytest.raises(RuntimeError) as exc_info:
-            await generator.generate_slide_content("title", {"title": "Test"})
-        
-        assert "not initialized" in str(exc_info.value) 
\ No newline at end of file
+async def test_generate_without_initialize():
+    """Test that generation is stateless and needs no initialize() call."""
+    client = MagicMock()
+    client.create_chat_completion = AsyncMock(return_value=completion("Title content"))
+    generator = SlideContentGenerator(openai_client=client)
+    
+    result = await generator.generate_slide_content("title", TITLE_VARIABLES)
+    
+    assert result["content"] == "Title content"
+    client.create_chat_completion.assert_awaited_once()
+
+@pytest.mark.asyncio
+async def test_generate_multiple_slides_batches_by_template():
+    """Test that slides sharing a template are generated in one call."""
+    client = MagicMock()
+    client.create_chat_completion = AsyncMock(side_effect=[
+        completion('{"slides": ["First", "Second"]}'),
+        completion("Title content")
+    ])
+    generator = SlideContentGenerator(openai_client=client)
+    title_variables = {
+        "title": "Test Title",
+        "subtitle": "Test Subtitle",
+        "presenter": "Test User",
+        "date": "2024-03-31"
+    }
+    slides = [
+        {"template_type": "content", "variables": CONTENT_VARIABLES},
+        {"template_type": "title", "variables": title_variables},
+        {"template_type": "content", "variables": CONTENT_VARIABLES}
+    ]
+    
+    results = await generator.generate_multiple_slides(slides)
+    
+    assert [result["content"] for result in results] == ["First", "Title content", "Second"]
+    assert [result["type"] for result in results] == ["content", "title", "content"]
+    assert client.create_chat_completion.await_count == 2
+
+@pytest.mark.asyncio
+async def test_iter_slide_contents_batches_by_template():
+    """Test that the streaming path used by the builder batches too, yielding in order."""
+    async def create(**kwargs):
+        if "response_format" in kwargs:
+            return completion('{"slides": ["First", "Second"]}')
+        return completion("Title content")
+    
+    client = MagicMock()
+    client.create_chat_completion = AsyncMock(side_effect=create)
+    generator = SlideContentGenerator(openai_client=client)
+    slides = [
+        {"template_type": "title", "variables": TITLE_VARIABLES},
+        {"template_type": "content", "variables": CONTENT_VARIABLES},
+        {"template_type": "content", "variables": CONTENT_VARIABLES}
+    ]
+    
+    results = [content async for content in generator.iter_slide_contents(slides)]
+    
+    assert [result["content"] for result in results] == ["Title content", "First", "Second"]
+    assert client.create_chat_completion.await_count == 2
+
+@pytest.mark.asyncio
+async def test_generate_multiple_slides_batch_fallback():
+    """Test that an unparsable batch falls back to one call per slide."""
+    client = MagicMock()
+    client.create_chat_completion = AsyncMock(side_effect=[
+        completion("not json"),
+        completion("First"),
+        completion("Second")
+    ])
+    generator = SlideContentGenerator(openai_client=client)
+    slides = [{"template_type": "content", "variables": CONTENT_VARIABLES}] * 2
+    
+    results = await generator.generate_multiple_slides(slides)
+    
+    assert [result["content"] for result in results] == ["First", "Second"]
+    assert client.create_chat_completion.await_count == 3
+
+@pytest.mark.asyncio
+async def test_batch_uses_llm_cache():
+    """Test that batched slides are read from and written to the LLM cache one by one."""
+    client = MagicMock()
+    client.create_chat_completion = AsyncMock(side_effect=[
+        completion("Cached first"),
+        completion('{"slides": ["Second", "Third"]}')
+    ])
+    generator = SlideContentGenerator(openai_client=client, cache=InMemoryLLMCache())
+    slides = [
+        {"template_type": "content", "variables": {**CONTENT_VARIABLES, "title": title}}
+        for title in ("First", "Second", "Third")
+    ]
+    await generator.generate_slide_content("content", slides[0]["variables"])
+    
+    results = await generator.generate_multiple_slides(slides)
+    
+    assert [result["content"] for result in results] == ["Cached first", "Second", "Third"]
+    batch_prompt = client.create_chat_completion.call_args.kwargs["messages"][-1]["content"]
+    assert "Generate 2 slides" in batch_prompt
+    
+    # Every slide is now cached, so repeating the deck makes no API calls
+    assert await generator.generate_multiple_slides(slides) == results
+    assert client.create_chat_completion.await_count == 2
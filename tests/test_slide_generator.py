@@ -4,6 +4,8 @@ Tests for slide generation functionality.
 import os
 import pytest
 from pathlib import Path
+from pptx import Presentation
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
 from src.core.slide_generator import SlideGenerator
 
 @pytest.fixture
@@ -122,6 +124,58 @@ def test_multiple_slides(slide_generator, temp_pptx):
     slide_generator.save(temp_pptx)
     assert temp_pptx.exists()
 
+def test_create_slide_sync(slide_generator):
+    """Test creating a slide from a generated content entry."""
+    slide = slide_generator.create_slide_sync({
+        "type": "section_transition",
+        "content": {"current_section": "Introduction", "next_section": "Details"}
+    })
+    
+    assert slide is slide_generator.prs.slides[-1]
+    assert slide.shapes.title.text == "Introduction"
+    
+    with pytest.raises(ValueError):
+        slide_generator.create_slide_sync({"type": "unknown", "content": {}})
+
+def test_add_slide_keeps_ids_and_relationships(slide_generator, temp_pptx):
+    """Test that slides added directly get unique IDs and correct relationships."""
+    for index in range(5):
+        slide_generator.create_section_transition({
+            "current_section": f"Section {index}",
+            "next_section": f"Section {index + 1}"
+        })
+    # A slide added by other code must not make the generator reuse its ID
+    slide_generator.prs.slides.add_slide(slide_generator.prs.slide_layouts[1])
+    slide_generator.create_content_slide({"title": "Last", "key_points": "- Point"})
+    
+    part = slide_generator.prs.part
+    slide_part = slide_generator.prs.slides[2].part
+    rId = slide_generator.prs.slides._sldIdLst[2].rId
+    assert part.relate_to(slide_part, RT.SLIDE) == rId
+    sld_ids = slide_generator.prs.slides._sldIdLst
+    assert len({sldId.rId for sldId in sld_ids}) == 7
+    assert len({sldId.id for sldId in sld_ids}) == 7
+    
+    slide_generator.save(temp_pptx)
+    assert len(Presentation(temp_pptx).slides) == 7
+
+def test_add_paragraphs_matches_per_paragraph_styling(slide_generator):
+    """Test that cloned bullet paragraphs match individually styled ones."""
+    items = ["First point", "Second\nwith a break", "", "Fourth"]
+    layout = slide_generator.prs.slide_layouts[1]
+    expected_tf = slide_generator.prs.slides.add_slide(layout).placeholders[1].text_frame
+    actual_tf = slide_generator.prs.slides.add_slide(layout).placeholders[1].text_frame
+    
+    for item in items:
+        p = expected_tf.add_paragraph()
+        p.text = item
+        p.level = 1
+        slide_generator.theme_manager.apply_text_style(p, "body")
+    slide_generator._add_paragraphs(actual_tf, items, level=1)
+    
+    assert [p.text for p in actual_tf.paragraphs] == [p.text for p in expected_tf.paragraphs]
+    assert actual_tf._txBody.xml == expected_tf._txBody.xml
+
 def test_template_loading(tmp_path):
     """Test loading a template file."""
     # This test will be skipped if no template file is available
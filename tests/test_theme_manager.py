@@ -0,0 +1,50 @@
+"""
+Tests for theme management.
+"""
+from lxml import etree
+from pptx import Presentation
+from pptx.dml.color import RGBColor
+from pptx.util import Pt
+from src.core.theme_manager import ThemeManager
+
+def test_custom_theme_does_not_modify_default():
+    """Test that merging a custom theme leaves other instances untouched."""
+    custom = ThemeManager({"colors": {"primary": RGBColor(255, 0, 0)}})
+    default = ThemeManager()
+    
+    assert custom.get_color("primary") == RGBColor(255, 0, 0)
+    assert default.get_color("primary") == RGBColor(0, 114, 198)
+    assert ThemeManager.DEFAULT_THEME["colors"]["primary"] == RGBColor(0, 114, 198)
+
+def test_apply_text_style_uses_custom_fonts():
+    """Test that custom font settings are applied to paragraphs."""
+    theme_manager = ThemeManager({
+        "fonts": {
+            "body": {"name": "Arial", "size": Pt(20), "bold": True, "color": RGBColor(1, 2, 3)}
+        }
+    })
+    slide = Presentation().slides.add_slide(Presentation().slide_layouts[6])
+    paragraph = slide.shapes.add_textbox(0, 0, 100, 100).text_frame.paragraphs[0]
+    
+    theme_manager.apply_text_style(paragraph, "body")
+    
+    assert paragraph.font.name == "Arial"
+    assert paragraph.font.size == Pt(20)
+    assert paragraph.font.bold is True
+    assert paragraph.font.color.rgb == RGBColor(1, 2, 3)
+
+def test_apply_text_style_matches_setters():
+    """Test that the pPr template gives the same XML as the individual setters."""
+    theme_manager = ThemeManager()
+    slide = Presentation().slides.add_slide(Presentation().slide_layouts[6])
+    text_frame = slide.shapes.add_textbox(0, 0, 100, 100).text_frame
+    
+    for style_type, style in theme_manager._text_styles.items():
+        expected = text_frame.add_paragraph()
+        expected.level = 2
+        theme_manager._set_text_style(expected, style)
+        actual = text_frame.add_paragraph()
+        actual.level = 2
+        theme_manager.apply_text_style(actual, style_type)
+        
+        assert etree.tostring(actual._p, method="c14n") == etree.tostring(expected._p, method="c14n")